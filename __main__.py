@@ -12,17 +12,32 @@ import os
 import sys
 import argparse
 import logging
-from typing import List
+from pathlib import Path
+from typing import List, Optional
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from src.config import configure_logging, load_config, parse_article_urls
 
-from src.config import Config
-from src.agent import run_agent
 
+# Defaults resolved once at import time
+_DEFAULT_URLS = os.getenv("ARTICLE_URLS", "")
+_DEFAULT_LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
-def parse_args():
-    """Parse command line arguments."""
+BANNER = """
+    ╔══════════════════════════════════════════╗
+    ║       Voice Agent Module v1.0.0          ║
+    ║                                          ║
+    ║  🎙️  Real-time voice conversations       ║
+    ║  📰 Article knowledge extraction         ║
+    ║  🚀 Railway-ready deployment             ║
+    ╚══════════════════════════════════════════╝
+    """
+
+# Argument parser, built on first use
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser."""
     parser = argparse.ArgumentParser(
         description="Voice Agent Module - Process articles and start voice conversations"
     )
@@ -31,31 +46,58 @@ def parse_args():
         "--urls",
         type=str,
         help="Comma-separated list of article URLs to process",
-        default=os.getenv("ARTICLE_URLS", "")
+        default=_DEFAULT_URLS
     )
     
     parser.add_argument(
         "--config",
-        type=str,
+        type=Path,
         help="Path to .env configuration file",
-        default=".env"
+        default=Path(".env")
     )
     
     parser.add_argument(
         "--log-level",
         type=str,
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
-        default=os.getenv("LOG_LEVEL", "INFO"),
+        default=_DEFAULT_LOG_LEVEL,
         help="Logging level"
     )
     
+    parser.add_argument(
+        "--no-kb-cache",
+        action="store_true",
+        help="Always re-extract and re-process articles instead of using the cached knowledge base"
+    )
+    
+    parser.add_argument(
+        "--yes", "-y",
+        action="store_true",
+        help="Don't prompt for confirmation (e.g. when no article URLs are given)"
+    )
+    
     parser.add_argument(
         "--test",
         action="store_true",
         help="Run in test mode (validate configuration only)"
     )
     
-    return parser.parse_args()
+    return parser
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+    """
+    global _PARSER
+    
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    
+    return _PARSER.parse_args(argv)
 
 
 def main():
@@ -63,34 +105,19 @@ def main():
     args = parse_args()
     
     # Set up logging
-    logging.basicConfig(
-        level=getattr(logging, args.log_level),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    configure_logging(args.log_level)
     
     logger = logging.getLogger(__name__)
     
-    print("""
-    ╔══════════════════════════════════════════╗
-    ║       Voice Agent Module v1.0.0          ║
-    ║                                          ║
-    ║  🎙️  Real-time voice conversations       ║
-    ║  📰 Article knowledge extraction         ║
-    ║  🚀 Railway-ready deployment             ║
-    ╚══════════════════════════════════════════╝
-    """)
+    print(BANNER)
     
     try:
-        # Load configuration
-        if args.config and os.path.exists(args.config):
+        # Load and validate configuration (cached across calls)
+        if args.config.is_file():
             logger.info(f"Loading configuration from {args.config}")
-            config = Config.from_file(args.config)
         else:
             logger.info("Loading configuration from environment")
-            config = Config.from_env()
-        
-        # Validate configuration
-        config.validate()
+        config = load_config(str(args.config))
         logger.info("Configuration validated successfully")
         
         # Test mode - just validate and exit
@@ -102,10 +129,7 @@ def main():
             return 0
         
         # Parse article URLs
-        article_urls: List[str] = []
-        
-        if args.urls:
-            article_urls = [url.strip() for url in args.urls.split(",") if url.strip()]
+        article_urls: List[str] = parse_article_urls(args.urls)
         
         if not article_urls:
             print("\n⚠️  No article URLs provided!")
@@ -113,9 +137,11 @@ def main():
             print("1. Command line: python -m voice-agent-module --urls 'url1,url2'")
             print("2. Environment variable: ARTICLE_URLS='url1,url2'")
             print("\nStarting agent without articles - you can still have conversations.")
-            response = input("\nContinue anyway? (y/n): ")
-            if response.lower() != 'y':
-                return 0
+            # Only prompt when someone can answer; containers usually have no TTY
+            if not args.yes and sys.stdin.isatty():
+                response = input("\nContinue anyway? (y/n): ")
+                if response.lower() != 'y':
+                    return 0
         else:
             print(f"\n📰 Processing {len(article_urls)} articles:")
             for i, url in enumerate(article_urls, 1):
@@ -127,7 +153,10 @@ def main():
         print("   Press Ctrl+C to stop.\n")
         
         # Run the agent
-        run_agent(article_urls, config)
+        # Imported here so --test doesn't pay for loading LiveKit and its plugins
+        from src.agent import run_agent
+        
+        run_agent(article_urls, config, use_kb_cache=not args.no_kb_cache)
         
     except KeyboardInterrupt:
         print("\n\n👋 Shutting down gracefully...")
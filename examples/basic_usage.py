@@ -9,14 +9,13 @@ This script demonstrates how to use the Voice Agent Module to:
 Requirements:
 - Set up your .env file with all required API keys
 - Have article URLs ready to process
+
+Run from the project root so the src package is importable:
+    python -m examples.basic_usage
 """
 
-import os
-import sys
 import logging
-
-# Add parent directory to path to import our modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dataclasses import replace
 
 from src.config import Config
 from src.agent import run_agent, VoiceAgent
@@ -134,13 +133,14 @@ def example_custom_configuration():
     print("=== Custom Configuration Example ===\n")
     
     # Create custom configuration
-    config = Config.from_env()
-    
-    # Override defaults
-    config.llm_model = "gpt-4o"  # Use more powerful model
-    config.stt_model = "nova-2"  # Use different STT model
-    config.tts_voice_id = "custom-voice-id"  # Use custom voice
-    config.language = "es"  # Spanish language
+    # Config is immutable, so derive a copy with the overridden defaults
+    config = replace(
+        Config.from_env(),
+        llm_model="gpt-4o",  # Use more powerful model
+        stt_model="nova-2",  # Use different STT model
+        tts_voice_id="custom-voice-id",  # Use custom voice
+        language="es",  # Spanish language
+    )
     
     print("Custom configuration:")
     print(f"  LLM Model: {config.llm_model}")
@@ -13,20 +13,146 @@ Key Features:
 - Production-ready error handling and logging
 """
 
+import asyncio
+import contextlib
+import functools
+import hashlib
+import json
 import logging
 import os
-from typing import Optional, List, Dict, Any
-from livekit import agents
-from livekit.agents import AgentSession, Agent, RunContext, WorkerOptions, cli, function_tool
-from livekit.plugins import deepgram, cartesia, openai, silero
+import textwrap
+import threading
+import time
+from typing import TYPE_CHECKING, Optional, List, Dict, Any
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; builds there aren't coordinated
+    fcntl = None
 
 from .article_extractor import ArticleExtractor
 from .knowledge_base import KnowledgeBase
-from .config import Config
+from .config import Config, configure_logging, load_config, parse_article_urls
+
+# LiveKit and its plugins are heavy to import (httpx, websockets, onnxruntime)
+# They are imported where they are used so Config-only code paths stay fast
+if TYPE_CHECKING:
+    from livekit import agents
+    from livekit.agents import WorkerOptions
 
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
+# Base system prompt for the agent; knowledge base context is appended to it
+_BASE_INSTRUCTIONS = textwrap.dedent("""\
+    You are a helpful voice assistant with knowledge about specific articles.
+    You can discuss the content of these articles, answer questions about them, and provide
+    insights based on the information you have.
+    
+    Key capabilities:
+    - Answer questions about articles in my knowledge base
+    - Search for specific topics across all articles
+    - Get detailed information about specific subjects
+    - List all articles currently available
+    - IMPORTANT: Process new articles that users provide! If a user gives you a URL or asks you to analyze an article, use the add_article function to process it.
+    
+    Be conversational, friendly, and informative. When users mention URLs or ask you to analyze articles,
+    proactively offer to process them for them.""")
+
+# On-disk cache of processed knowledge bases, keyed by the set of article URLs
+KB_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "voice-agent")
+KB_CACHE_TTL = 24 * 60 * 60  # seconds
+# URLs a cached knowledge base is missing are retried after this long (seconds)
+KB_CACHE_RETRY_TTL = 10 * 60
+
+# Longest a knowledge query waits for the initial knowledge base (seconds)
+KB_READY_TIMEOUT = 120.0
+
+# Articles added during a conversation are batched for this long (seconds)
+INGEST_BATCH_WINDOW = 0.5
+# Longest a knowledge query waits for queued articles to finish (seconds)
+INGEST_WAIT_TIMEOUT = 60.0
+
+def _build_session_template(config: Config) -> Dict[str, Dict[str, Any]]:
+    """
+    Build the plugin constructor arguments for voice sessions.
+    
+    Args:
+        config: Configuration object with model and voice settings
+        
+    Returns:
+        Dictionary with 'stt', 'llm' and 'tts' keyword arguments
+    """
+    return {
+        "stt": {
+            "model": config.stt_model,
+            "language": config.language,
+            # The plugin's defaults are already tuned for latency: interim
+            # results, no_delay and 25ms endpointing, with filler words and
+            # punctuation kept for the turn detector
+        },
+        "llm": {
+            "model": config.llm_model,
+        },
+        "tts": {
+            # cartesia.TTS takes these as flat keyword arguments
+            "model": config.tts_model,
+            "voice": config.tts_voice_id,
+            "speed": "normal",
+            "language": config.language,
+            # 16-bit PCM rather than f32, so the stream stays half the size
+            "encoding": "pcm_s16le",
+            # 24 kHz divides evenly into WebRTC's 48 kHz, so playout
+            # doesn't need an arbitrary-ratio resample on every chunk
+            "sample_rate": 24000,
+        },
+    }
+
+
+def warm_up():
+    """
+    Import the voice plugins ahead of the first job.
+    
+    LiveKit plugins register themselves on import and must be imported
+    on the main thread of the worker process; importing them here, before
+    cli.run_app, also lets the CLI fetch their model files. Heavy
+    per-process state such as the VAD model is loaded in prewarm.
+    """
+    from livekit.plugins import deepgram, cartesia, openai, silero  # noqa: F401
+    
+    logger.info("Voice plugins warmed up")
+
+
+def _kb_cache_path(article_urls: List[str]) -> str:
+    """
+    Get the cache file path for a set of article URLs.
+    
+    Args:
+        article_urls: Article URLs of the knowledge base
+        
+    Returns:
+        Path of the cached knowledge base file
+    """
+    key = hashlib.sha256(",".join(sorted(set(article_urls))).encode()).hexdigest()
+    return os.path.join(KB_CACHE_DIR, f"kb_{key}.json")
+
+
+def clear_kb_cache(article_urls: List[str]):
+    """
+    Delete the cached knowledge base for a set of article URLs.
+    
+    Args:
+        article_urls: Article URLs of the knowledge base
+    """
+    cache_path = _kb_cache_path(article_urls)
+    for path in (cache_path, cache_path + ".npy", cache_path + ".txt", cache_path + ".failed"):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not delete cached knowledge base file %s: %s", path, e)
+
 
 class VoiceAgent:
     """
@@ -39,14 +165,17 @@ class VoiceAgent:
     - Real-time voice processing
     """
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, use_kb_cache: bool = True):
         """
         Initialize the voice agent with configuration.
         
         Args:
             config: Configuration object with API keys and settings
+            use_kb_cache: Reuse a processed knowledge base from disk when
+                the same article URLs were processed recently
         """
         self.config = config
+        self.use_kb_cache = use_kb_cache
         
         # Initialize components
         self.article_extractor = ArticleExtractor(timeout=30)
@@ -58,6 +187,25 @@ class VoiceAgent:
         # Store article URLs to process
         self.article_urls: List[str] = []
         
+        # Function tools, built on first use and shared by all jobs
+        self._tools: Optional[List[Any]] = None
+        
+        # Set once the initial knowledge base preparation has finished
+        self._kb_ready = threading.Event()
+        
+        # Background ingestion of articles added during conversations
+        self._ingest_queue: Optional[asyncio.Queue] = None
+        self._ingest_task: Optional[asyncio.Task] = None
+        self._pending_articles: Dict[str, asyncio.Event] = {}
+        # Queued URLs that couldn't be added, with the reason; reported to
+        # the user by the next knowledge tool call
+        self._failed_articles: Dict[str, str] = {}
+        
+        # Cached agent instructions, rebuilt when the knowledge base changes
+        self._instructions_cache: Optional[str] = None
+        self._instructions_version: int = -1
+        self._kb_version: int = 0
+        
         logger.info("VoiceAgent initialized")
     
     def add_article_urls(self, urls: List[str]):
@@ -67,125 +215,596 @@ class VoiceAgent:
         Args:
             urls: List of article URLs to process
         """
-        self.article_urls.extend(urls)
-        logger.info(f"Added {len(urls)} article URLs to process")
+        # Ordered de-duplication so no URL is extracted twice
+        known = set(self.article_urls)
+        new_urls = [url for url in dict.fromkeys(urls) if url not in known]
+        
+        self.article_urls.extend(new_urls)
+        logger.info("Added %d article URLs to process", len(new_urls))
     
     def prepare_knowledge_base(self):
         """
         Extract articles and build the knowledge base.
         
         This method should be called before starting the agent
-        to ensure the knowledge base is ready.
+        to ensure the knowledge base is ready. See
+        prepare_knowledge_base_in_background for a non-blocking variant.
+        It doesn't use asyncio, so it can also be called from code
+        running in an event loop (which it blocks until done).
+        """
+        self._finish_preparation(in_background=False)
+    
+    def _finish_preparation(self, in_background: bool):
+        """
+        Prepare the knowledge base and mark it ready, even if preparing fails.
+        
+        Args:
+            in_background: Running in the background preparation thread
+        """
+        try:
+            self._prepare_knowledge_base(in_background)
+        finally:
+            self._kb_ready.set()
+        
+        # Build the instructions now so the first job doesn't have to
+        self.get_agent_instructions()
+    
+    def prepare_knowledge_base_in_background(self) -> threading.Thread:
+        """
+        Build the knowledge base in a background thread.
+        
+        The agent can accept jobs right away; the knowledge tools wait
+        for preparation to finish before answering.
+        
+        Returns:
+            The started background thread
+        """
+        def run():
+            try:
+                self._finish_preparation(in_background=True)
+            except Exception as e:
+                logger.error("Error preparing knowledge base: %s", e, exc_info=True)
+        
+        thread = threading.Thread(target=run, name="prepare-knowledge-base", daemon=True)
+        thread.start()
+        return thread
+    
+    async def wait_until_ready(self, timeout: Optional[float] = KB_READY_TIMEOUT):
+        """
+        Wait for the initial knowledge base preparation to finish.
+        
+        Args:
+            timeout: Maximum time to wait in seconds (None waits until done)
+        """
+        if not self._kb_ready.is_set():
+            logger.info("Waiting for the knowledge base to be ready")
+            await asyncio.to_thread(self._kb_ready.wait, timeout)
+    
+    def _prepare_knowledge_base(self, in_background: bool):
+        """
+        Extract articles and build the knowledge base (see prepare_knowledge_base).
+        
+        Args:
+            in_background: Running in the background preparation thread
         """
         if not self.article_urls:
             logger.warning("No article URLs to process")
             return
         
-        logger.info(f"Processing {len(self.article_urls)} articles...")
+        if not self.use_kb_cache:
+            self._process_articles(self.article_urls, in_background)
+            return
         
-        # Extract articles
-        articles = self.article_extractor.extract_multiple(self.article_urls)
+        # Every job process prepares the knowledge base at the same time, so
+        # only the lock holder builds it; the others wait and load its cache
+        cache_path = self._kb_cache_path()
+        with self._kb_cache_lock(cache_path):
+            if self._load_cached_knowledge_base(cache_path):
+                self._retry_failed_articles(cache_path, in_background)
+                return
+            
+            failed = self._process_articles(self.article_urls, in_background)
+            self._save_kb_cache(cache_path, failed)
+    
+    def _process_articles(self, urls: List[str], in_background: bool) -> List[str]:
+        """
+        Extract article URLs and process them into the knowledge base.
+        
+        Args:
+            urls: Article URLs to add
+            in_background: Running in the background preparation thread,
+                which has no event loop of its own and builds with asyncio
+            
+        Returns:
+            The URLs that could not be added to the knowledge base
+        """
+        logger.info("Processing %d articles...", len(urls))
+        
+        # Extract and process articles concurrently. asyncio.run can't be
+        # used by a caller that is already running an event loop
+        if in_background:
+            articles = asyncio.run(self._build_knowledge_base_async(urls))
+        else:
+            articles = self._build_knowledge_base(urls)
         
         if not articles:
             logger.error("Failed to extract any articles")
+            return list(urls)
+        
+        logger.info("Knowledge base ready with %d articles", len(self.knowledge_base.knowledge_store))
+        
+        added = {article['url'] for article in articles if self.knowledge_base.contains_article(article)}
+        failed = [url for url in urls if url not in added]
+        if failed:
+            logger.warning("%d article URLs could not be added", len(failed))
+        return failed
+    
+    def _retry_failed_articles(self, cache_path: str, in_background: bool):
+        """
+        Retry the URLs a cached knowledge base couldn't add.
+        
+        Failed URLs are retried at most once every KB_CACHE_RETRY_TTL
+        seconds, and only they are fetched again; the articles that were
+        added are kept from the cache.
+        
+        Args:
+            cache_path: Path of the cached knowledge base file
+            in_background: Running in the background preparation thread
+        """
+        failed_path = cache_path + ".failed"
+        try:
+            age = time.time() - os.path.getmtime(failed_path)
+            with open(failed_path, 'r', encoding='utf-8') as f:
+                failed = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        if not failed or age <= KB_CACHE_RETRY_TTL:
+            return
+        
+        logger.info("Retrying %d articles the cached knowledge base is missing", len(failed))
+        try:
+            still_failed = self._process_articles(failed, in_background)
+        except Exception as e:
+            logger.error("Error retrying articles: %s", e)
+            return
+        
+        if len(still_failed) < len(failed):
+            # The articles from the cache are no newer than before, so the
+            # cache keeps its original expiry time
+            self._save_kb_cache(cache_path, still_failed, keep_mtime=True)
+        else:
+            # Rewriting the list restarts the wait before the next retry
+            try:
+                self._write_failed_urls(cache_path, still_failed)
+            except OSError as e:
+                logger.warning("Could not write knowledge base cache: %s", e)
+    
+    def _save_kb_cache(self, cache_path: str, failed: List[str], keep_mtime: bool = False):
+        """
+        Write the knowledge base and the URLs it is missing to the cache.
+        
+        Args:
+            cache_path: Path of the cached knowledge base file
+            failed: Article URLs that could not be added
+            keep_mtime: Keep the modification time, and with it the expiry,
+                of the cache file being replaced
+        """
+        try:
+            os.makedirs(KB_CACHE_DIR, exist_ok=True)
+            mtime = os.path.getmtime(cache_path) if keep_mtime else None
+            # The failed list goes first, so a cache is never read as
+            # complete when it isn't
+            self._write_failed_urls(cache_path, failed)
+            self.knowledge_base.save_to_file(cache_path)
+            if mtime is not None:
+                os.utime(cache_path, (mtime, mtime))
+        except Exception as e:
+            logger.warning("Could not write knowledge base cache: %s", e)
+    
+    @staticmethod
+    def _write_failed_urls(cache_path: str, failed: List[str]):
+        """
+        Record the article URLs a cached knowledge base is missing.
+        
+        Args:
+            cache_path: Path of the cached knowledge base file
+            failed: Article URLs that could not be added (the record is
+                deleted if empty)
+        """
+        failed_path = cache_path + ".failed"
+        if not failed:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(failed_path)
+            return
+        
+        tmp_path = f"{failed_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(failed, f)
+        os.replace(tmp_path, failed_path)
+    
+    @contextlib.contextmanager
+    def _kb_cache_lock(self, cache_path: str):
+        """
+        Hold an exclusive lock on a knowledge base cache file.
+        
+        Blocks until no other process holds the lock. Without fcntl, or
+        if the lock file can't be created, nothing is locked.
+        
+        Args:
+            cache_path: Path of the cached knowledge base file
+        """
+        if fcntl is None:
+            yield
+            return
+        
+        lock_path = os.path.splitext(cache_path)[0] + ".lock"
+        try:
+            os.makedirs(KB_CACHE_DIR, exist_ok=True)
+            lock_file = open(lock_path, 'a')
+        except OSError as e:
+            logger.warning("Could not lock knowledge base cache: %s", e)
+            yield
             return
         
-        # Process into knowledge base
-        self.knowledge_base.add_articles(articles)
+        with lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _build_knowledge_base(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract article URLs and process them into the knowledge base.
+        
+        Args:
+            urls: Article URLs to add
+            
+        Returns:
+            List of extracted articles
+        """
+        # Extract articles
+        try:
+            articles = self.article_extractor.extract_multiple(urls)
+        finally:
+            # Don't keep idle parse workers around; see _build_knowledge_base_async
+            self.article_extractor.close()
+        
+        if articles:
+            # Process into knowledge base
+            self.knowledge_base.add_articles(articles)
+            self._kb_version += 1
+        
+        return articles
+    
+    async def _build_knowledge_base_async(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract article URLs and process them into the knowledge base.
+        
+        Used by the background preparation thread; the downloads share
+        one keep-alive connection pool on the thread's event loop.
+        
+        Args:
+            urls: Article URLs to add
+            
+        Returns:
+            List of extracted articles
+        """
+        # Extract articles
+        try:
+            articles = await self.article_extractor.extract_multiple_async(urls)
+        finally:
+            # Don't keep idle parse workers around for the life of the job
+            # process; articles added later start them again on demand
+            await asyncio.to_thread(self.article_extractor.close)
+        
+        if articles:
+            # Process into knowledge base
+            await self.knowledge_base.add_articles_async(articles)
+            self._kb_version += 1
+        
+        return articles
+    
+    def _kb_cache_path(self) -> str:
+        """
+        Get the cache file path for the current set of article URLs.
+        
+        Returns:
+            Path of the cached knowledge base file
+        """
+        return _kb_cache_path(self.article_urls)
+    
+    def _load_cached_knowledge_base(self, cache_path: str) -> bool:
+        """
+        Load the knowledge base from disk if a fresh cache file exists.
+        
+        Args:
+            cache_path: Path of the cached knowledge base file
+            
+        Returns:
+            True if the knowledge base was loaded from the cache
+        """
+        try:
+            age = time.time() - os.path.getmtime(cache_path)
+        except OSError:
+            return False
+        
+        if age > KB_CACHE_TTL:
+            logger.info("Cached knowledge base has expired, rebuilding")
+            return False
         
-        logger.info(f"Knowledge base ready with {len(articles)} articles")
+        try:
+            self.knowledge_base.load_from_file(cache_path)
+        except Exception:
+            return False
+        
+        self._kb_version += 1
+        logger.info("Knowledge base loaded from cache with %d articles", len(self.knowledge_base.knowledge_store))
+        return True
     
     def get_agent_instructions(self) -> str:
         """
         Generate instructions for the agent based on the knowledge base.
         
+        The result is cached and only rebuilt after the knowledge base
+        has been modified.
+        
         Returns:
             Instruction string for the agent
         """
-        base_instructions = """You are a helpful voice assistant with knowledge about specific articles.
-        You can discuss the content of these articles, answer questions about them, and provide
-        insights based on the information you have. 
-        
-        Key capabilities:
-        - Answer questions about articles in my knowledge base
-        - Search for specific topics across all articles
-        - Get detailed information about specific subjects
-        - List all articles currently available
-        - IMPORTANT: Process new articles that users provide! If a user gives you a URL or asks you to analyze an article, use the add_article function to process it.
+        # Until the knowledge base is ready the tools supply context on demand
+        if not self._kb_ready.is_set():
+            return _BASE_INSTRUCTIONS
         
-        Be conversational, friendly, and informative. When users mention URLs or ask you to analyze articles, 
-        proactively offer to process them for them."""
+        if self._instructions_cache is not None and self._instructions_version == self._kb_version:
+            return self._instructions_cache
         
         # Add knowledge context
         context = self.knowledge_base.get_conversation_context()
         
-        return f"{base_instructions}\n\n{context}"
+        self._instructions_cache = _BASE_INSTRUCTIONS + "\n\n" + context
+        self._instructions_version = self._kb_version
+        return self._instructions_cache
+    
+    def start_ingest_worker(self):
+        """
+        Start the background task that processes queued article URLs.
+        
+        Must be called from within the running event loop. Calling it
+        again while the worker is running does nothing.
+        """
+        if self._ingest_task is not None and not self._ingest_task.done():
+            return
+        
+        self._ingest_queue = asyncio.Queue()
+        self._ingest_task = asyncio.create_task(self._ingest_worker())
+    
+    async def queue_article(self, url: str):
+        """
+        Queue an article URL for background processing.
+        
+        Args:
+            url: The URL of the article to process
+        """
+        self.start_ingest_worker()
+        
+        self._pending_articles[url] = asyncio.Event()
+        await self._ingest_queue.put(url)
+    
+    async def wait_for_knowledge(self):
+        """Wait for the initial knowledge base and any queued articles."""
+        await self.wait_until_ready()
+        await self.wait_for_pending_articles()
+    
+    async def wait_for_pending_articles(self, timeout: float = INGEST_WAIT_TIMEOUT):
+        """
+        Wait until queued articles have been added to the knowledge base.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+        """
+        events = list(self._pending_articles.values())
+        if not events:
+            return
+        
+        logger.info("Waiting for %d queued articles to be processed", len(events))
+        waiters = [asyncio.create_task(event.wait()) for event in events]
+        _, pending = await asyncio.wait(waiters, timeout=timeout)
+        
+        for waiter in pending:
+            waiter.cancel()
+    
+    async def _ingest_worker(self):
+        """
+        Process queued article URLs in batches.
+        
+        After the first URL arrives, further URLs are collected until
+        none arrive for INGEST_BATCH_WINDOW seconds. The batch is then
+        extracted and processed concurrently in one pass.
+        """
+        while True:
+            batch = [await self._ingest_queue.get()]
+            
+            while True:
+                try:
+                    batch.append(await asyncio.wait_for(self._ingest_queue.get(), timeout=INGEST_BATCH_WINDOW))
+                except asyncio.TimeoutError:
+                    break
+            
+            # The initial build replaces the knowledge store when it loads
+            # the cache and shuts down the extractor when it's done, so
+            # queued articles are only processed after it has finished
+            await self.wait_until_ready(timeout=None)
+            
+            logger.info("Processing %d queued articles", len(batch))
+            
+            try:
+                articles = await self.article_extractor.extract_multiple_async(batch)
+                extracted = {article['url'] for article in articles}
+                for url in batch:
+                    if url not in extracted:
+                        self._failed_articles[url] = "the page couldn't be downloaded or had no article text"
+                
+                if articles:
+                    await self.knowledge_base.add_articles_async(articles)
+                    added = []
+                    for article in articles:
+                        if self.knowledge_base.contains_article(article):
+                            added.append(article['url'])
+                        else:
+                            self._failed_articles[article['url']] = "the article couldn't be analyzed"
+                    self.add_article_urls(added)
+                    self._kb_version += 1
+            except Exception as e:
+                logger.error("Error processing queued articles: %s", e)
+                for url in batch:
+                    self._failed_articles[url] = f"processing failed ({e})"
+            finally:
+                for url in batch:
+                    event = self._pending_articles.pop(url, None)
+                    if event is not None:
+                        event.set()
+    
+    def _failure_notice(self) -> str:
+        """
+        Report queued articles that failed since the last report.
+        
+        Returns:
+            Message listing the failed URLs and why, or an empty string
+        """
+        if not self._failed_articles:
+            return ""
+        
+        failures = "; ".join(f"{url}: {reason}" for url, reason in self._failed_articles.items())
+        self._failed_articles.clear()
+        return f"Note: I couldn't add some of the articles you gave me ({failures}).\n\n"
+    
+    async def search_knowledge(self, query: str) -> str:
+        """
+        Search the knowledge base for information about a specific topic.
+        
+        Args:
+            query: What to look for
+            
+        Returns:
+            Summaries of the best matching articles
+        """
+        logger.info("Searching knowledge base for: %s", query)
+        
+        await self.wait_for_knowledge()
+        # Searching embeds the query with OpenAI, so keep it off the event loop
+        results = await asyncio.to_thread(self.knowledge_base.search, query, 2)
+        
+        if not results:
+            return self._failure_notice() + "I couldn't find specific information about that topic in my knowledge base."
+        
+        # Format results for the agent
+        response = []
+        for entry in results:
+            title = entry['metadata'].get('title', 'Untitled')
+            summary = entry['summary']
+            response.append(f"From '{title}': {summary}")
+        
+        return self._failure_notice() + "\n\n".join(response)
+    
+    async def get_detailed_info(self, topic: str) -> str:
+        """
+        Get detailed information about a specific topic from the knowledge base.
+        
+        Args:
+            topic: Topic to look up
+            
+        Returns:
+            Detailed information, or a message saying none was found
+        """
+        logger.info("Getting detailed info for: %s", topic)
+        
+        await self.wait_for_knowledge()
+        details = await asyncio.to_thread(self.knowledge_base.get_detailed_info, topic)
+        
+        if not details:
+            return f"I don't have detailed information about '{topic}' in my current knowledge base."
+        
+        return details
+    
+    async def list_articles(self) -> str:
+        """List all articles currently in the knowledge base."""
+        await self.wait_for_knowledge()
+        
+        return self.knowledge_base.get_articles_listing()
+    
+    async def add_article(self, url: str) -> str:
+        """
+        Queue a new article URL to be added to the knowledge base.
+        
+        Args:
+            url: The URL of the article to process and analyze
+            
+        Returns:
+            Message for the agent to relay to the user
+        """
+        logger.info("Processing new article from URL: %s", url)
+        
+        # A failed URL added again is retried rather than reported
+        self._failed_articles.pop(url, None)
+        notice = self._failure_notice()
+        
+        # Don't re-extract articles that are already in the knowledge base
+        for entry in self.knowledge_base.knowledge_store:
+            if entry['metadata'].get('url') == url:
+                title = entry['metadata'].get('title') or 'Untitled'
+                return notice + f"I've already processed the article '{title}'. You can ask me questions about it!"
+        
+        if url in self._pending_articles:
+            return notice + "I'm already working on that article. You can ask me about it in a moment!"
+        
+        # Extraction and processing happen in the background so the
+        # conversation isn't blocked on the download and OpenAI calls
+        await self.queue_article(url)
+        
+        return notice + "Got it! I'm reading that article now. Ask me about it whenever you like and I'll answer as soon as it's processed."
     
     def create_function_tools(self):
         """
         Create custom function tools for the agent.
         
+        The tools only close over this instance, so they are built once
+        and the same list is returned on every subsequent call.
+        
         Returns:
             List of function tools the agent can use
         """
-        # Tool to search the knowledge base
+        if self._tools is not None:
+            return self._tools
+        
+        from livekit.agents import RunContext, function_tool
+        
+        # function_tool sets attributes on the function it wraps, so it can't
+        # decorate the bound methods directly; these wrappers only delegate
         @function_tool
         async def search_knowledge(
             context: RunContext,
             query: str,
         ):
             """Search the knowledge base for information about a specific topic."""
-            logger.info(f"Searching knowledge base for: {query}")
-            
-            results = self.knowledge_base.search(query, top_k=2)
-            
-            if not results:
-                return "I couldn't find specific information about that topic in my knowledge base."
-            
-            # Format results for the agent
-            response = []
-            for entry in results:
-                title = entry['metadata'].get('title', 'Untitled')
-                summary = entry['summary']
-                response.append(f"From '{title}': {summary}")
-            
-            return "\n\n".join(response)
+            return await self.search_knowledge(query)
         
-        # Tool to get detailed information
         @function_tool
         async def get_detailed_info(
             context: RunContext,
             topic: str,
         ):
             """Get detailed information about a specific topic from the knowledge base."""
-            logger.info(f"Getting detailed info for: {topic}")
-            
-            details = self.knowledge_base.get_detailed_info(topic)
-            
-            if not details:
-                return f"I don't have detailed information about '{topic}' in my current knowledge base."
-            
-            return details
+            return await self.get_detailed_info(topic)
         
-        # Tool to list available articles
         @function_tool
         async def list_articles(
             context: RunContext,
         ):
             """List all articles currently in the knowledge base."""
-            if not self.knowledge_base.knowledge_store:
-                return "No articles are currently loaded in the knowledge base."
-            
-            articles = []
-            for entry in self.knowledge_base.knowledge_store:
-                title = entry['metadata'].get('title', 'Untitled')
-                url = entry['metadata'].get('url', '')
-                topics = ", ".join(entry['topics'][:3])  # First 3 topics
-                articles.append(f"• {title} - Topics: {topics}")
-            
-            return "Articles in my knowledge base:\n" + "\n".join(articles)
+            return await self.list_articles()
         
-        # Tool to process new articles during conversation
         @function_tool
         async def add_article(
             context: RunContext,
@@ -196,50 +815,82 @@ class VoiceAgent:
             Args:
                 url: The URL of the article to process and analyze
             """
-            logger.info(f"Processing new article from URL: {url}")
-            
-            try:
-                # Extract the article
-                article = self.article_extractor.extract_from_url(url)
-                
-                if not article:
-                    return f"Sorry, I couldn't extract content from that URL: {url}. Please check if the URL is accessible and contains readable text."
-                
-                # Process it into the knowledge base
-                self.knowledge_base.add_articles([article])
-                
-                title = article.get('title', 'Untitled')
-                word_count = article.get('word_count', 0)
-                
-                logger.info(f"Successfully added article: {title} ({word_count} words)")
-                
-                return f"Great! I've successfully processed and added the article '{title}' ({word_count} words) to my knowledge base. You can now ask me questions about it!"
-                
-            except Exception as e:
-                logger.error(f"Error processing article from {url}: {e}")
-                return f"I encountered an error while processing that article: {str(e)}. Please try a different URL or check if the article is publicly accessible."
+            return await self.add_article(url)
         
-        return [search_knowledge, get_detailed_info, list_articles, add_article]
+        self._tools = [search_knowledge, get_detailed_info, list_articles, add_article]
+        return self._tools
 
 
-# Global voice agent instance
-voice_agent: Optional[VoiceAgent] = None
+def prewarm(
+    proc: "agents.JobProcess",
+    article_urls: List[str],
+    config: Config,
+    use_kb_cache: bool = True
+):
+    """
+    Prepare a LiveKit job process before it receives any jobs.
+    
+    Creates the VoiceAgent and the voice session settings once per
+    process and stores them in proc.userdata, where entrypoint picks
+    them up for every job the process runs. The knowledge base is built
+    in the background so the process is available for jobs right away;
+    processes prewarmed together share one build through the cache.
+    
+    Args:
+        proc: The LiveKit job process being initialized
+        article_urls: List of article URLs to process
+        config: Configuration object with API keys and settings
+        use_kb_cache: Reuse a cached knowledge base for the same URLs
+    """
+    from livekit.plugins import openai, silero
+    
+    voice_agent = VoiceAgent(config, use_kb_cache=use_kb_cache)
+    voice_agent.add_article_urls(article_urls)
+    voice_agent.prepare_knowledge_base_in_background()
+    
+    # Build (and cache) the function tools now so the first job doesn't
+    # pay for the decorator's schema introspection
+    voice_agent.create_function_tools()
+    
+    # Heavy per-process state lives in proc.userdata rather than module globals
+    proc.userdata["voice_agent"] = voice_agent
+    proc.userdata["vad"] = silero.VAD.load()
+    
+    # Constructor arguments for the STT/TTS plugins
+    # Their clients are bound to a job's HTTP context, so each session
+    # still gets fresh instances built from this template
+    template = _build_session_template(config)
+    proc.userdata["session_template"] = template
+    
+    # The LLM owns its own pooled OpenAI client, so one instance serves
+    # every job in this process and keeps its connections warm
+    proc.userdata["llm"] = openai.LLM(**template["llm"])
+    
+    logger.info("Job process prewarmed")
 
 
-async def entrypoint(ctx: agents.JobContext):
+async def entrypoint(ctx: "agents.JobContext"):
     """
     Main entrypoint for the LiveKit agent.
     
     This function is called when a new agent job is created.
     It sets up the voice interaction and starts the conversation.
     """
-    global voice_agent
+    from livekit.agents import AgentSession, Agent
+    from livekit.plugins import deepgram, cartesia
+    
+    logger.info("Agent entrypoint called for job %s", ctx.job.id)
     
-    logger.info(f"Agent entrypoint called for job {ctx.job.id}")
+    # Per-process state prepared by prewarm
+    voice_agent: VoiceAgent = ctx.proc.userdata["voice_agent"]
+    template = ctx.proc.userdata["session_template"]
     
     # Connect to the LiveKit room
     await ctx.connect()
     
+    # Process articles added during the conversation in the background
+    voice_agent.start_ingest_worker()
+    
     # Create the agent configuration
     agent = Agent(
         instructions=voice_agent.get_agent_instructions(),
@@ -248,30 +899,10 @@ async def entrypoint(ctx: agents.JobContext):
     
     # Create the agent session with voice components
     session = AgentSession(
-        vad=silero.VAD.load(),  # Voice Activity Detection
-        stt=deepgram.STT(  # Speech-to-Text
-            model=voice_agent.config.stt_model,
-            language=voice_agent.config.language,
-        ),
-        llm=openai.LLM(  # Large Language Model
-            model=voice_agent.config.llm_model,
-        ),
-        tts=cartesia.TTS(  # Text-to-Speech
-            model_id=voice_agent.config.tts_model,
-            voice={
-                "id": voice_agent.config.tts_voice_id,
-                "experimental_controls": {
-                    "speed": "normal",
-                    "emotion": [],
-                },
-            },
-            language=voice_agent.config.language,
-            output_format={
-                "container": "raw",
-                "encoding": "pcm_f32le",
-                "sample_rate": 22050,
-            },
-        ),
+        vad=ctx.proc.userdata["vad"],  # Voice Activity Detection (loaded in prewarm)
+        stt=deepgram.STT(**template["stt"]),  # Speech-to-Text
+        llm=ctx.proc.userdata["llm"],  # Large Language Model (shared in process)
+        tts=cartesia.TTS(**template["tts"]),  # Text-to-Speech
     )
     
     # Start the session
@@ -289,36 +920,51 @@ async def entrypoint(ctx: agents.JobContext):
 
 def initialize_agent(
     article_urls: List[str],
-    config: Optional[Config] = None
-) -> WorkerOptions:
+    config: Optional[Config] = None,
+    use_kb_cache: bool = True
+) -> "WorkerOptions":
     """
     Initialize the voice agent with article URLs.
     
-    This function prepares the agent with article knowledge
-    and returns WorkerOptions for running the agent.
+    This function returns WorkerOptions for running the agent. Each
+    job process prepares the article knowledge base in the background
+    from its prewarm hook, so the worker registers without waiting.
+    One process builds it and the others wait for the cache file and
+    load it.
     
     Args:
         article_urls: List of article URLs to process
         config: Optional configuration (uses defaults if not provided)
+        use_kb_cache: Reuse a cached knowledge base for the same URLs;
+            if False, the cached one is deleted once here, and the job
+            processes still share a single rebuild
         
     Returns:
         WorkerOptions configured for the agent
     """
-    global voice_agent
+    from livekit.agents import WorkerOptions
     
-    # Use provided config or create from environment
+    # Use provided config or load (cached) from environment
     if config is None:
-        config = Config.from_env()
+        config = load_config()
     
-    # Create and prepare the voice agent
-    voice_agent = VoiceAgent(config)
-    voice_agent.add_article_urls(article_urls)
-    voice_agent.prepare_knowledge_base()
+    # Job processes are single-use, so rebuilding in each of them would
+    # repeat every download and OpenAI request per job; a fresh build is
+    # forced by discarding the cache instead
+    if not use_kb_cache:
+        clear_kb_cache(article_urls)
     
     # Return worker options
     # Note: Updated to current LiveKit Agents API (v1.0+)
+    # Each job process builds its own VoiceAgent in prewarm and receives it
+    # through proc.userdata instead of a module-level global
     return WorkerOptions(
-        entrypoint_fnc=entrypoint
+        entrypoint_fnc=entrypoint,
+        prewarm_fnc=functools.partial(
+            prewarm,
+            article_urls=list(article_urls),
+            config=config,
+        ),
     )
 
 
@@ -332,10 +978,9 @@ def get_article_urls_from_env() -> List[str]:
         List of article URLs to process
     """
     # Check environment variable first
-    env_urls = os.getenv("ARTICLE_URLS", "")
-    if env_urls:
-        urls = [url.strip() for url in env_urls.split(",") if url.strip()]
-        logger.info(f"Using {len(urls)} article URLs from ARTICLE_URLS environment variable")
+    urls = parse_article_urls()
+    if urls:
+        logger.info("Using %d article URLs from ARTICLE_URLS environment variable", len(urls))
         return urls
     
     # Fallback URLs - replace with your articles
@@ -348,11 +993,11 @@ def get_article_urls_from_env() -> List[str]:
         # "https://medium.com/@you/your-post",
         # "https://blog.yourcompany.com/product-update"
     ]
-    logger.info(f"Using {len(example_urls)} example article URLs (set ARTICLE_URLS env var for custom URLs)")
+    logger.info("Using %d example article URLs (set ARTICLE_URLS env var for custom URLs)", len(example_urls))
     return example_urls
 
 
-def create_worker_options(config: Optional[Config] = None) -> WorkerOptions:
+def create_worker_options(config: Optional[Config] = None) -> "WorkerOptions":
     """
     Create WorkerOptions for the LiveKit CLI.
     
@@ -364,12 +1009,6 @@ def create_worker_options(config: Optional[Config] = None) -> WorkerOptions:
     Returns:
         WorkerOptions instance for the LiveKit CLI
     """
-    # Set up logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    
     logger.info("Initializing voice agent for LiveKit CLI...")
     
     # Get article URLs from environment or fallback to examples
@@ -377,12 +1016,15 @@ def create_worker_options(config: Optional[Config] = None) -> WorkerOptions:
     
     # Initialize agent with articles
     worker_options = initialize_agent(article_urls, config)
+    
+    # Load heavy models before the worker starts accepting jobs
+    warm_up()
     logger.info("Voice agent initialized and ready for LiveKit CLI")
     
     return worker_options
 
 
-def run_agent(article_urls: List[str], config: Config):
+def run_agent(article_urls: List[str], config: Config, use_kb_cache: bool = True):
     """
     Run the voice agent with the provided configuration and article URLs.
     
@@ -392,17 +1034,20 @@ def run_agent(article_urls: List[str], config: Config):
     Args:
         article_urls: List of article URLs to process for the knowledge base
         config: Configuration object with API keys and settings
+        use_kb_cache: Reuse a cached knowledge base for the same URLs
     """
-    # Set up logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    from livekit.agents import cli
+    
+    # Set up logging (no-op if the caller already configured it)
+    configure_logging(config.log_level_no)
     
     logger.info("Starting voice agent...")
     
     # Initialize agent with articles
-    worker_options = initialize_agent(article_urls, config)
+    worker_options = initialize_agent(article_urls, config, use_kb_cache)
+    
+    # Load heavy models before the worker starts accepting jobs
+    warm_up()
     
     # Run with LiveKit CLI
     # This starts the agent and keeps it running
@@ -411,12 +1056,16 @@ def run_agent(article_urls: List[str], config: Config):
 
 # Main entry point for LiveKit CLI
 if __name__ == "__main__":
+    from livekit.agents import cli
+    
+    # Set up logging before anything else logs
+    configure_logging(os.getenv("LOG_LEVEL", "INFO"))
+    
     # Load configuration from environment
     try:
-        config = Config.from_env()
-        config.validate()
+        config = load_config()
     except ValueError as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         logger.info("Please set the required environment variables (see .env.example)")
         exit(1)
     
@@ -12,20 +12,135 @@ Key Features:
 - Support for various article formats and websites
 """
 
+import asyncio
+import hashlib
+import json
 import logging
+import multiprocessing
+import os
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Optional, Dict, Any
-from urllib.parse import urlparse
+import aiohttp
+import requests
 import trafilatura
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from trafilatura.settings import use_config
 
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
-# Configure trafilatura for better extraction
-# This config improves extraction quality and handles edge cases
+# Configure trafilatura for extraction
+# The default config runs a single extraction pass, which is enough for
+# typical article pages and much cheaper than the extensive mode
 TRAFILATURA_CONFIG = use_config()
 TRAFILATURA_CONFIG.set("DEFAULT", "EXTRACTION_TIMEOUT", "30")  # 30 second timeout
-TRAFILATURA_CONFIG.set("DEFAULT", "EXTENSIVE_EXTRACTION", "true")  # More thorough extraction
+TRAFILATURA_CONFIG.set("DEFAULT", "EXTENSIVE_EXTRACTION", "false")
+
+# Slower config that also runs the fallback extractors, for hard-to-parse sites
+EXTENSIVE_TRAFILATURA_CONFIG = use_config()
+EXTENSIVE_TRAFILATURA_CONFIG.set("DEFAULT", "EXTRACTION_TIMEOUT", "30")
+EXTENSIVE_TRAFILATURA_CONFIG.set("DEFAULT", "EXTENSIVE_EXTRACTION", "true")  # More thorough extraction
+
+# Maximum number of articles downloaded at the same time
+MAX_CONCURRENT_EXTRACTIONS = 8
+
+# Upper bound on download threads and pooled HTTP connections
+MAX_POOL_SIZE = 32
+
+# Worker processes for parsing downloaded pages; each is a full interpreter
+# with lxml loaded, so a few are enough even on large hosts. The affinity
+# mask reflects CPUs actually available to this process (os.cpu_count
+# reports the host's); it's missing on macOS and Windows
+try:
+    _AVAILABLE_CPUS = len(os.sched_getaffinity(0))
+except AttributeError:
+    _AVAILABLE_CPUS = os.cpu_count() or 1
+MAX_PARSE_WORKERS = min(4, _AVAILABLE_CPUS)
+
+# Start method for the parse workers; the pool is started from a thread of
+# a multithreaded (LiveKit job) process, which fork would copy mid-state
+PARSE_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# Matches an http(s) URL, capturing the scheme and the host (netloc)
+_URL_RE = re.compile(r"^(https?)://([^/\s?#]+)", re.I)
+
+# Default directory for cached extractions, next to the knowledge base cache
+ARTICLE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "voice-agent", "articles")
+
+# Cached extractions not written or revalidated for this many cache TTLs
+# are deleted, so the cache doesn't grow with every URL ever added
+CACHE_MAX_AGE_TTLS = 7
+
+# Browser-like User-Agent; some sites refuse requests without one
+USER_AGENT = "Mozilla/5.0 (compatible; VoiceAgentModule/1.0)"
+
+
+def _parse_article(
+    downloaded: bytes,
+    url: str,
+    domain: str,
+    extensive: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    Extract the main text and metadata from a downloaded page.
+    
+    This is CPU-bound and holds the GIL, so ArticleExtractor runs it in
+    worker processes; it's a module-level function so it can be pickled.
+    
+    Args:
+        downloaded: Raw HTML of the page, undecoded; trafilatura detects
+            the encoding
+        url: The URL the page was downloaded from
+        domain: The domain of the URL
+        extensive: Use trafilatura's extensive extraction
+        
+    Returns:
+        Article dictionary, or None if no text could be extracted
+    """
+    # Extract the main content
+    # output_format='txt' for plain text (easier for LLM processing)
+    # include_comments=False to avoid extracting comment sections
+    # include_tables=False to focus on main text content
+    # include_links=False to avoid URL clutter in text
+    extract_options = dict(
+        output_format='txt',
+        include_comments=False,
+        include_tables=False,
+        include_links=False,
+        config=EXTENSIVE_TRAFILATURA_CONFIG if extensive else TRAFILATURA_CONFIG
+    )
+    text = trafilatura.extract(downloaded, **extract_options)
+    
+    # Retry pages the fast pass couldn't handle, favoring recall
+    if not text:
+        text = trafilatura.extract(downloaded, favor_recall=True, **extract_options)
+    
+    if not text:
+        return None
+    
+    # Extract metadata
+    # This includes title, author, date, and other useful information
+    metadata = trafilatura.extract_metadata(downloaded)
+    
+    # Build the result dictionary
+    result = {
+        'text': text,
+        'url': url,
+        'domain': domain,
+        'title': metadata.title if metadata else None,
+        'author': metadata.author if metadata else None,
+        'date': metadata.date if metadata else None,
+        # str.split() runs entirely in C; counting regex matches with
+        # finditer avoids the list but is several times slower
+        'word_count': len(text.split())  # Approximate word count
+    }
+    
+    return result
 
 
 class ArticleExtractor:
@@ -39,15 +154,74 @@ class ArticleExtractor:
     - Handle extraction errors gracefully
     """
     
-    def __init__(self, timeout: int = 30):
+    def __init__(
+        self,
+        timeout: int = 30,
+        cache_dir: Optional[str] = ARTICLE_CACHE_DIR,
+        cache_ttl: int = 86400,
+        extensive: bool = False
+    ):
         """
         Initialize the ArticleExtractor.
         
         Args:
             timeout: Maximum time to wait for article download (seconds)
+            cache_dir: Directory for cached extractions (None disables caching)
+            cache_ttl: How long a cached extraction is used without
+                revalidating it with the server (seconds); entries older
+                than CACHE_MAX_AGE_TTLS times this are deleted
+            extensive: Use trafilatura's slower extensive extraction, which
+                tries several extractors per page
         """
         self.timeout = timeout
-        logger.info(f"ArticleExtractor initialized with timeout={timeout}s")
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        self.extensive = extensive
+        
+        # Set when an extraction is cached; old entries are swept once per
+        # batch (and on close) rather than on every write
+        self._cache_written = False
+        
+        # Parsing is CPU-bound, so it runs in worker processes to keep the
+        # GIL free for the event loop; the pool is started on first use
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._use_parse_pool = True
+        # extract_multiple parses from many threads at once
+        self._parse_pool_lock = threading.Lock()
+        
+        # Persistent HTTP session so downloads reuse TCP/TLS connections
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=MAX_POOL_SIZE,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        
+        logger.info("ArticleExtractor initialized with timeout=%ss", timeout)
+    
+    def close(self):
+        """
+        Release the pooled HTTP connections and parsing processes.
+        
+        Also deletes expired cache entries if anything was cached. The
+        extractor can still be used afterwards; the connections and
+        processes are started again on demand.
+        """
+        self._sweep_cache()
+        self._session.close()
+        with self._parse_pool_lock:
+            pool, self._parse_pool = self._parse_pool, None
+        if pool is not None:
+            pool.shutdown()
+    
+    def __enter__(self) -> "ArticleExtractor":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def extract_from_url(self, url: str) -> Optional[Dict[str, Any]]:
         """
@@ -72,88 +246,431 @@ class ArticleExtractor:
         """
         try:
             # Validate URL format
-            parsed_url = urlparse(url)
-            if not parsed_url.scheme or not parsed_url.netloc:
-                logger.error(f"Invalid URL format: {url}")
+            match = _URL_RE.match(url)
+            if not match:
+                logger.error("Invalid URL format: %s", url)
                 return None
+            domain = match.group(2)
+            
+            cached = self._read_cache(url)
+            if cached and cached['fresh']:
+                logger.info("Using cached article for: %s", url)
+                return cached['article']
             
-            logger.info(f"Extracting article from: {url}")
+            logger.info("Extracting article from: %s", url)
             
-            # Download the article content
-            # include_comments=False to avoid extracting comment sections
-            # include_tables=False to focus on main text content
-            # Note: trafilatura.fetch_url() doesn't accept timeout parameter
-            downloaded = trafilatura.fetch_url(url)
+            # Download the article content over the pooled session
+            # A stale cache entry is revalidated with a conditional request
+            response = self._session.get(
+                url,
+                timeout=self.timeout,
+                headers=self._revalidation_headers(cached)
+            )
+            
+            if response.status_code == 304 and cached:
+                logger.info("Cached article is still current: %s", url)
+                self._touch_cache(url)
+                return cached['article']
+            
+            if not response.ok:
+                logger.error("Failed to download content from: %s (HTTP %s)", url, response.status_code)
+                return None
+            
+            # Undecoded, so trafilatura detects the charset; response.text
+            # assumes ISO-8859-1 for text/html without one
+            downloaded = response.content
             
             if not downloaded:
-                logger.error(f"Failed to download content from: {url}")
+                logger.error("Failed to download content from: %s", url)
                 return None
             
-            # Extract the main content
-            # output_format='txt' for plain text (easier for LLM processing)
-            # include_links=False to avoid URL clutter in text
-            text = trafilatura.extract(
-                downloaded,
-                output_format='txt',
-                include_comments=False,
-                include_tables=False,
-                include_links=False,
-                deduplicate=True,  # Remove duplicate content
-                config=TRAFILATURA_CONFIG
-            )
+            result = self._parse(downloaded, url, domain)
+            if result:
+                self._write_cache(url, result, response.headers)
+            return result
             
-            if not text:
-                logger.error(f"Failed to extract text from: {url}")
+        except Exception as e:
+            logger.error("Error extracting article from %s: %s", url, e)
+            return None
+    
+    async def extract_from_url_async(
+        self,
+        url: str,
+        session: aiohttp.ClientSession
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Extract article content and metadata from a URL without blocking.
+        
+        The download runs on the event loop through the given session, and
+        the CPU-bound parsing runs in a worker process.
+        
+        Args:
+            url: The URL of the article to extract
+            session: HTTP session to download with (shares its connection pool)
+            
+        Returns:
+            Same dictionary as extract_from_url, or None if extraction fails
+        """
+        try:
+            # Validate URL format
+            match = _URL_RE.match(url)
+            if not match:
+                logger.error("Invalid URL format: %s", url)
+                return None
+            domain = match.group(2)
+            
+            cached = await asyncio.to_thread(self._read_cache, url)
+            if cached and cached['fresh']:
+                logger.info("Using cached article for: %s", url)
+                return cached['article']
+            
+            logger.info("Extracting article from: %s", url)
+            
+            async with session.get(url, headers=self._revalidation_headers(cached)) as response:
+                if response.status == 304 and cached:
+                    logger.info("Cached article is still current: %s", url)
+                    self._touch_cache(url)
+                    return cached['article']
+                
+                if not response.ok:
+                    logger.error("Failed to download content from: %s (HTTP %s)", url, response.status)
+                    return None
+                
+                headers = response.headers
+                # Undecoded, so trafilatura detects the charset
+                downloaded = await response.read()
+            
+            if not downloaded:
+                logger.error("Failed to download content from: %s", url)
                 return None
             
-            # Extract metadata
-            # This includes title, author, date, and other useful information
-            metadata = trafilatura.extract_metadata(downloaded)
-            
-            # Build the result dictionary
-            result = {
-                'text': text,
-                'url': url,
-                'domain': parsed_url.netloc,
-                'title': metadata.title if metadata else None,
-                'author': metadata.author if metadata else None,
-                'date': metadata.date if metadata else None,
-                'word_count': len(text.split())  # Approximate word count
-            }
-            
-            logger.info(f"Successfully extracted {result['word_count']} words from: {url}")
+            result = await self._parse_async(downloaded, url, domain)
+            if result:
+                await asyncio.to_thread(self._write_cache, url, result, headers)
             return result
             
         except Exception as e:
-            logger.error(f"Error extracting article from {url}: {str(e)}")
+            logger.error("Error extracting article from %s: %s", url, e)
             return None
     
+    def _cache_path(self, url: str) -> Optional[str]:
+        """
+        Get the cache file path for a URL.
+        
+        Args:
+            url: The article URL
+            
+        Returns:
+            Path of the cache file, or None if caching is disabled
+        """
+        if not self.cache_dir:
+            return None
+        
+        key = hashlib.sha256(url.encode()).hexdigest()
+        # Extensive extraction can find text the fast pass misses, so the
+        # two modes don't share cached results
+        if self.extensive:
+            key += ".extensive"
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def _read_cache(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Read the cached extraction for a URL.
+        
+        Args:
+            url: The article URL
+            
+        Returns:
+            Cache record with 'article', 'etag', 'last_modified' and a
+            'fresh' flag (True if within cache_ttl), or None if not cached
+        """
+        path = self._cache_path(url)
+        if path is None:
+            return None
+        
+        try:
+            age = time.time() - os.path.getmtime(path)
+            with open(path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        record['fresh'] = age <= self.cache_ttl
+        return record
+    
+    def _write_cache(self, url: str, article: Dict[str, Any], headers: Any):
+        """
+        Atomically write an extraction to the cache.
+        
+        Args:
+            url: The article URL
+            article: Extracted article dictionary
+            headers: Response headers (used for ETag / Last-Modified)
+        """
+        path = self._cache_path(url)
+        if path is None:
+            return
+        
+        record = {
+            'article': article,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+        }
+        
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(record, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not cache article %s: %s", url, e)
+            return
+        
+        self._cache_written = True
+    
+    def _sweep_cache(self):
+        """
+        Delete cache files older than CACHE_MAX_AGE_TTLS cache TTLs.
+        
+        Age is measured from when an entry was last written or
+        revalidated, so articles that are still in use are kept. Does
+        nothing unless an extraction was cached since the last sweep.
+        """
+        if not self._cache_written:
+            return
+        self._cache_written = False
+        
+        cutoff = time.time() - CACHE_MAX_AGE_TTLS * self.cache_ttl
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file() and entry.stat().st_mtime < cutoff:
+                            os.remove(entry.path)
+                    except OSError:
+                        pass  # Removed by another process, or not ours to remove
+        except OSError as e:
+            logger.warning("Could not clean up article cache: %s", e)
+    
+    def _touch_cache(self, url: str):
+        """
+        Mark a revalidated cache entry as fresh again.
+        
+        Args:
+            url: The article URL
+        """
+        path = self._cache_path(url)
+        if path is None:
+            return
+        
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+    
+    @staticmethod
+    def _revalidation_headers(cached: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Build conditional request headers for a stale cache entry.
+        
+        Args:
+            cached: Cache record from _read_cache, if any
+            
+        Returns:
+            If-None-Match / If-Modified-Since headers (may be empty)
+        """
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+    
+    def _get_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Get the process pool used for parsing, starting it on first use.
+        
+        Returns:
+            The pool, or None if parsing has fallen back to threads
+        """
+        with self._parse_pool_lock:
+            if self._parse_pool is None and self._use_parse_pool:
+                self._parse_pool = ProcessPoolExecutor(
+                    max_workers=MAX_PARSE_WORKERS,
+                    mp_context=multiprocessing.get_context(PARSE_START_METHOD)
+                )
+            return self._parse_pool
+    
+    def _disable_parse_pool(self, error: BaseException):
+        """
+        Fall back to parsing in threads after the process pool failed.
+        
+        Args:
+            error: Why the pool couldn't be used
+        """
+        logger.warning("Parsing in worker processes failed (%s), falling back to threads", error)
+        with self._parse_pool_lock:
+            self._use_parse_pool = False
+            pool, self._parse_pool = self._parse_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _parse(self, downloaded: bytes, url: str, domain: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse a downloaded page in the process pool.
+        
+        Args:
+            downloaded: Raw, undecoded HTML of the page
+            url: The URL the page was downloaded from
+            domain: The domain of the URL
+            
+        Returns:
+            Article dictionary, or None if no text could be extracted
+        """
+        pool = self._get_parse_pool()
+        if pool is not None:
+            try:
+                return self._log_parse_result(
+                    pool.submit(_parse_article, downloaded, url, domain, self.extensive).result(), url
+                )
+            except (BrokenProcessPool, AssertionError, OSError) as e:
+                self._disable_parse_pool(e)
+            except RuntimeError:
+                pass  # The pool was shut down after we got it; parse here instead
+        
+        return self._log_parse_result(_parse_article(downloaded, url, domain, self.extensive), url)
+    
+    async def _parse_async(self, downloaded: bytes, url: str, domain: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse a downloaded page in the process pool without blocking the event loop.
+        
+        Args:
+            downloaded: Raw, undecoded HTML of the page
+            url: The URL the page was downloaded from
+            domain: The domain of the URL
+            
+        Returns:
+            Article dictionary, or None if no text could be extracted
+        """
+        pool = self._get_parse_pool()
+        if pool is not None:
+            loop = asyncio.get_running_loop()
+            try:
+                result = await loop.run_in_executor(
+                    pool, _parse_article, downloaded, url, domain, self.extensive
+                )
+                return self._log_parse_result(result, url)
+            except (BrokenProcessPool, AssertionError, OSError) as e:
+                self._disable_parse_pool(e)
+            except RuntimeError:
+                pass  # The pool was shut down after we got it; parse here instead
+        
+        result = await asyncio.to_thread(_parse_article, downloaded, url, domain, self.extensive)
+        return self._log_parse_result(result, url)
+    
+    @staticmethod
+    def _log_parse_result(result: Optional[Dict[str, Any]], url: str) -> Optional[Dict[str, Any]]:
+        """
+        Log the outcome of parsing a page.
+        
+        Worker processes don't share this process's logging setup, so
+        results are logged here rather than in _parse_article.
+        
+        Args:
+            result: Article dictionary, or None if no text was extracted
+            url: The URL the page was downloaded from
+            
+        Returns:
+            The result, unchanged
+        """
+        if result:
+            logger.info("Successfully extracted %d words from: %s", result['word_count'], url)
+        else:
+            logger.error("Failed to extract text from: %s", url)
+        return result
+    
     def extract_multiple(self, urls: list[str]) -> list[Dict[str, Any]]:
         """
         Extract content from multiple URLs.
         
-        This method processes multiple URLs and returns successfully
-        extracted articles. Failed extractions are logged but don't
-        stop the process.
+        URLs are downloaded concurrently in a thread pool, so total time
+        is close to the slowest download rather than the sum of all of
+        them. Failed extractions are logged but don't stop the process.
         
         Args:
             urls: List of article URLs to extract
             
         Returns:
-            List of successfully extracted articles
+            List of successfully extracted articles, in input order
         """
-        results = []
+        if not urls:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_POOL_SIZE, len(urls))) as executor:
+            articles = list(executor.map(self.extract_from_url, urls))
         
-        for url in urls:
-            # Extract each article
-            article = self.extract_from_url(url)
+        self._sweep_cache()
+        return self._collect(urls, articles)
+    
+    async def extract_multiple_async(
+        self,
+        urls: list[str],
+        max_concurrency: int = MAX_CONCURRENT_EXTRACTIONS
+    ) -> list[Dict[str, Any]]:
+        """
+        Extract content from multiple URLs concurrently.
+        
+        All downloads share one keep-alive connection pool, at most
+        max_concurrency at a time, and parsing runs in worker processes.
+        
+        Args:
+            urls: List of article URLs to extract
+            max_concurrency: Maximum number of simultaneous downloads
+            
+        Returns:
+            List of successfully extracted articles, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        connector = aiohttp.TCPConnector(limit=MAX_POOL_SIZE, keepalive_timeout=60)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        
+        headers = {"User-Agent": USER_AGENT}
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+            async def extract(url: str) -> Optional[Dict[str, Any]]:
+                async with semaphore:
+                    return await self.extract_from_url_async(url, session)
             
+            articles = await asyncio.gather(*(extract(url) for url in urls))
+        
+        await asyncio.to_thread(self._sweep_cache)
+        return self._collect(urls, articles)
+    
+    def _collect(
+        self,
+        urls: list[str],
+        articles: list[Optional[Dict[str, Any]]]
+    ) -> list[Dict[str, Any]]:
+        """
+        Drop failed extractions and log a summary.
+        
+        Args:
+            urls: The URLs that were extracted
+            articles: Extraction result for each URL (None on failure)
+            
+        Returns:
+            List of successfully extracted articles
+        """
+        results = []
+        for url, article in zip(urls, articles):
             if article:
                 results.append(article)
             else:
-                logger.warning(f"Skipping failed extraction: {url}")
+                logger.warning("Skipping failed extraction: %s", url)
         
-        logger.info(f"Extracted {len(results)} out of {len(urls)} articles")
+        logger.info("Extracted %d out of %d articles", len(results), len(urls))
         return results
     
     def format_for_knowledge_base(self, article: Dict[str, Any]) -> str:
@@ -169,27 +686,20 @@ class ArticleExtractor:
         Returns:
             Formatted string ready for knowledge base processing
         """
-        # Build formatted output with metadata
-        formatted = []
-        
-        # Add metadata if available
-        if article.get('title'):
-            formatted.append(f"Title: {article['title']}")
-        
-        if article.get('author'):
-            formatted.append(f"Author: {article['author']}")
-        
-        if article.get('date'):
-            formatted.append(f"Date: {article['date']}")
-        
-        formatted.append(f"Source: {article['url']}")
-        formatted.append("")  # Empty line separator
-        
-        # Add the main content
-        formatted.append("Content:")
-        formatted.append(article['text'])
+        # Optional metadata lines, skipping fields the extractor didn't find
+        metadata = (
+            ("Title", article.get('title')),
+            ("Author", article.get('author')),
+            ("Date", article.get('date')),
+        )
         
-        return "\n".join(formatted)
+        return "\n".join((
+            *(f"{label}: {value}" for label, value in metadata if value),
+            f"Source: {article['url']}",
+            "",  # Empty line separator
+            "Content:",
+            article['text'],
+        ))
 
 
 # Example usage and testing
@@ -13,20 +13,76 @@ Key Features:
 
 import os
 import logging
-from typing import Optional
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Dict, List, Tuple, Union
+from dataclasses import dataclass, field
 
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
+# Environment variables that feed into Config.from_env
+# Used to fingerprint the environment for the config cache
+_CONFIG_ENV_VARS = (
+    "LIVEKIT_URL",
+    "LIVEKIT_API_KEY",
+    "LIVEKIT_API_SECRET",
+    "OPENAI_API_KEY",
+    "LLM_MODEL",
+    "DEEPGRAM_API_KEY",
+    "STT_MODEL",
+    "CARTESIA_API_KEY",
+    "TTS_MODEL",
+    "TTS_VOICE_ID",
+    "LANGUAGE",
+    "LOG_LEVEL",
+)
 
-@dataclass
+# Environment variables that must be set (and non-empty) for Config.from_env
+# A tuple rather than a set so missing variables are reported in a stable order
+REQUIRED_VARS = (
+    "LIVEKIT_URL",
+    "LIVEKIT_API_KEY",
+    "LIVEKIT_API_SECRET",
+    "OPENAI_API_KEY",
+    "DEEPGRAM_API_KEY",
+    "CARTESIA_API_KEY",
+)
+
+# Known model names; anything else is allowed but logged as unusual
+VALID_LLM_MODELS = frozenset({"gpt-4o-mini", "gpt-4o", "gpt-4-turbo", "gpt-3.5-turbo"})
+VALID_STT_MODELS = frozenset({"nova-3", "nova-2", "enhanced", "base"})
+VALID_TTS_MODELS = frozenset({"sonic-2", "sonic", "aura-2"})
+
+# Placeholder shown for secrets too short to partially reveal
+_MASKED = "***"
+
+# Log level names accepted in LOG_LEVEL / --log-level
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Set once the root logger has been configured by configure_logging
+_LOGGING_CONFIGURED = False
+
+# Parsed configurations keyed by (source, fingerprint)
+# File sources are keyed on path + mtime, the environment on its values
+_CONFIG_CACHE: Dict[Tuple[str, int], "Config"] = {}
+
+
+@dataclass(slots=True, frozen=True)
 class Config:
     """
     Configuration class for the voice agent.
     
     This dataclass holds all configuration values needed by the agent,
     including API keys, model selections, and service settings.
+    
+    Instances are immutable, so they can be cached and shared freely;
+    use dataclasses.replace() to derive a modified configuration.
     """
     
     # Required fields (no defaults) - must come first
@@ -59,6 +115,25 @@ class Config:
     language: str = "en"  # Language code
     log_level: str = "INFO"  # Logging level
     
+    # Derived fields, computed once in __post_init__
+    log_level_no: int = field(init=False, repr=False, compare=False)  # Numeric log level
+    
+    def __post_init__(self):
+        """
+        Check the LiveKit URL and resolve derived fields.
+        
+        This runs once per instance (including dataclasses.replace()),
+        so consumers never re-parse these values.
+        
+        Raises:
+            ValueError: If LIVEKIT_URL isn't a ws:// or wss:// URL
+        """
+        if self.livekit_url and not self.livekit_url.startswith(("ws://", "wss://")):
+            raise ValueError("LIVEKIT_URL must start with ws:// or wss://")
+        
+        # The dataclass is frozen, so derived fields are set via object
+        object.__setattr__(self, "log_level_no", _LOG_LEVELS.get(self.log_level.upper(), logging.INFO))
+    
     @classmethod
     def from_env(cls) -> "Config":
         """
@@ -74,20 +149,10 @@ class Config:
         Raises:
             ValueError: If required environment variables are missing
         """
-        # Check for required environment variables
-        required_vars = [
-            "LIVEKIT_URL",
-            "LIVEKIT_API_KEY",
-            "LIVEKIT_API_SECRET",
-            "OPENAI_API_KEY",
-            "DEEPGRAM_API_KEY",
-            "CARTESIA_API_KEY",
-        ]
-        
-        missing_vars = []
-        for var in required_vars:
-            if not os.getenv(var):
-                missing_vars.append(var)
+        env = os.environ
+        
+        # Check for required environment variables (empty counts as missing)
+        missing_vars = [var for var in REQUIRED_VARS if not env.get(var)]
         
         if missing_vars:
             raise ValueError(
@@ -98,26 +163,26 @@ class Config:
         # Create config with environment values
         config = cls(
             # LiveKit
-            livekit_url=os.getenv("LIVEKIT_URL", ""),
-            livekit_api_key=os.getenv("LIVEKIT_API_KEY", ""),
-            livekit_api_secret=os.getenv("LIVEKIT_API_SECRET", ""),
+            livekit_url=env["LIVEKIT_URL"],
+            livekit_api_key=env["LIVEKIT_API_KEY"],
+            livekit_api_secret=env["LIVEKIT_API_SECRET"],
             
             # OpenAI
-            openai_api_key=os.getenv("OPENAI_API_KEY", ""),
-            llm_model=os.getenv("LLM_MODEL", "gpt-4o-mini"),
+            openai_api_key=env["OPENAI_API_KEY"],
+            llm_model=env.get("LLM_MODEL", "gpt-4o-mini"),
             
             # Deepgram
-            deepgram_api_key=os.getenv("DEEPGRAM_API_KEY", ""),
-            stt_model=os.getenv("STT_MODEL", "nova-3"),
+            deepgram_api_key=env["DEEPGRAM_API_KEY"],
+            stt_model=env.get("STT_MODEL", "nova-3"),
             
             # Cartesia
-            cartesia_api_key=os.getenv("CARTESIA_API_KEY", ""),
-            tts_model=os.getenv("TTS_MODEL", "sonic-2"),
-            tts_voice_id=os.getenv("TTS_VOICE_ID", "a0e99841-438c-4a64-b679-ae501e7d6091"),
+            cartesia_api_key=env["CARTESIA_API_KEY"],
+            tts_model=env.get("TTS_MODEL", "sonic-2"),
+            tts_voice_id=env.get("TTS_VOICE_ID", "a0e99841-438c-4a64-b679-ae501e7d6091"),
             
             # General
-            language=os.getenv("LANGUAGE", "en"),
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
+            language=env.get("LANGUAGE", "en"),
+            log_level=env.get("LOG_LEVEL", "INFO"),
         )
         
         logger.info("Configuration loaded from environment variables")
@@ -140,9 +205,6 @@ class Config:
         if not self.livekit_url:
             raise ValueError("LIVEKIT_URL is required")
         
-        if not self.livekit_url.startswith(("ws://", "wss://")):
-            raise ValueError("LIVEKIT_URL must start with ws:// or wss://")
-        
         if not self.livekit_api_key or not self.livekit_api_secret:
             raise ValueError("LiveKit API credentials are required")
         
@@ -157,16 +219,13 @@ class Config:
             raise ValueError("CARTESIA_API_KEY is required")
         
         # Validate model selections
-        valid_llm_models = ["gpt-4o-mini", "gpt-4o", "gpt-4-turbo", "gpt-3.5-turbo"]
-        if self.llm_model not in valid_llm_models:
+        if self.llm_model not in VALID_LLM_MODELS:
             logger.warning(f"Unusual LLM model: {self.llm_model}")
         
-        valid_stt_models = ["nova-3", "nova-2", "enhanced", "base"]
-        if self.stt_model not in valid_stt_models:
+        if self.stt_model not in VALID_STT_MODELS:
             logger.warning(f"Unusual STT model: {self.stt_model}")
         
-        valid_tts_models = ["sonic-2", "sonic", "aura-2"]
-        if self.tts_model not in valid_tts_models:
+        if self.tts_model not in VALID_TTS_MODELS:
             logger.warning(f"Unusual TTS model: {self.tts_model}")
         
         # Validate language code
@@ -186,15 +245,16 @@ class Config:
         Returns:
             Dictionary with masked sensitive values
         """
+        mask = self._mask_value
         return {
             "livekit_url": self.livekit_url,
-            "livekit_api_key": self._mask_value(self.livekit_api_key),
-            "livekit_api_secret": self._mask_value(self.livekit_api_secret),
-            "openai_api_key": self._mask_value(self.openai_api_key),
+            "livekit_api_key": mask(self.livekit_api_key),
+            "livekit_api_secret": mask(self.livekit_api_secret),
+            "openai_api_key": mask(self.openai_api_key),
             "llm_model": self.llm_model,
-            "deepgram_api_key": self._mask_value(self.deepgram_api_key),
+            "deepgram_api_key": mask(self.deepgram_api_key),
             "stt_model": self.stt_model,
-            "cartesia_api_key": self._mask_value(self.cartesia_api_key),
+            "cartesia_api_key": mask(self.cartesia_api_key),
             "tts_model": self.tts_model,
             "tts_voice_id": self.tts_voice_id,
             "language": self.language,
@@ -212,9 +272,9 @@ class Config:
             Masked value showing only first 4 and last 4 characters
         """
         if not value or len(value) < 12:
-            return "***"
+            return _MASKED
         
-        return f"{value[:4]}...{value[-4:]}"
+        return value[:4] + "..." + value[-4:]
     
     def setup_logging(self):
         """
@@ -223,15 +283,7 @@ class Config:
         This method configures the logging system with the
         specified log level and format.
         """
-        log_level = getattr(logging, self.log_level.upper(), logging.INFO)
-        
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        logger.info(f"Logging configured with level: {self.log_level}")
+        configure_logging(self.log_level_no)
     
     @classmethod
     def from_file(cls, filepath: str) -> "Config":
@@ -248,13 +300,21 @@ class Config:
             Config instance
         """
         # Simple .env file parser
-        if os.path.exists(filepath):
+        # Reads the file in one go; skips comments and lines without '='
+        # and removes a matching pair of quotes around values
+        if os.path.isfile(filepath):
             with open(filepath, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        key, value = line.split('=', 1)
-                        os.environ[key.strip()] = value.strip()
+                data = f.read()
+            
+            pairs = (
+                line.split('=', 1)
+                for line in data.splitlines()
+                if '=' in line and not line.lstrip().startswith('#')
+            )
+            os.environ.update({
+                key.strip(): _unquote(value.strip())
+                for key, value in pairs
+            })
             
             logger.info(f"Loaded environment from {filepath}")
         else:
@@ -263,6 +323,103 @@ class Config:
         return cls.from_env()
 
 
+def configure_logging(level: Union[str, int] = "INFO"):
+    """
+    Configure the root logger once for the whole process.
+    
+    Subsequent calls are no-ops, so every entry point can call this
+    without stacking handlers or overriding an earlier choice.
+    
+    Args:
+        level: Log level name (DEBUG, INFO, WARNING, ERROR) or number
+    """
+    global _LOGGING_CONFIGURED
+    
+    if _LOGGING_CONFIGURED:
+        return
+    
+    if isinstance(level, str):
+        level = _LOG_LEVELS.get(level.upper(), logging.INFO)
+    
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    _LOGGING_CONFIGURED = True
+    
+    logger.info(f"Logging configured with level: {logging.getLevelName(level)}")
+
+
+def load_config(filepath: Optional[str] = None) -> Config:
+    """
+    Load and validate configuration, reusing previously parsed results.
+    
+    Configuration files are cached by path and modification time, so an
+    edited .env file is picked up on the next call. Without a file (or if
+    it doesn't exist), the configuration is cached by the current values
+    of the relevant environment variables.
+    
+    Args:
+        filepath: Optional path to a .env file
+        
+    Returns:
+        The cached (immutable) Config instance
+        
+    Raises:
+        ValueError: If the configuration is missing values or invalid
+    """
+    if filepath and os.path.isfile(filepath):
+        key = (os.path.abspath(filepath), os.stat(filepath).st_mtime_ns)
+    else:
+        key = ("<env>", hash(tuple(os.environ.get(var) for var in _CONFIG_ENV_VARS)))
+    
+    config = _CONFIG_CACHE.get(key)
+    if config is None:
+        if key[0] == "<env>":
+            config = Config.from_env()
+        else:
+            config = Config.from_file(filepath)
+        config.validate()
+        _CONFIG_CACHE[key] = config
+    else:
+        logger.debug(f"Using cached configuration for {key[0]}")
+    
+    return config
+
+
+def _unquote(value: str) -> str:
+    """Remove one matching pair of single or double quotes around a value."""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+@lru_cache(maxsize=8)
+def _split_urls(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated URL string, dropping blanks and duplicates."""
+    return tuple(dict.fromkeys(url.strip() for url in value.split(",") if url.strip()))
+
+
+def parse_article_urls(value: Optional[str] = None) -> List[str]:
+    """
+    Parse a comma-separated list of article URLs.
+    
+    Parsing is memoized on the raw string, so repeated lookups of the
+    same ARTICLE_URLS value are free.
+    
+    Args:
+        value: Comma-separated URLs (defaults to the ARTICLE_URLS variable)
+        
+    Returns:
+        List of unique article URLs in their original order
+    """
+    if value is None:
+        value = os.getenv("ARTICLE_URLS", "")
+    
+    return list(_split_urls(value))
+
+
 # Example usage and testing
 if __name__ == "__main__":
     # Set up basic logging
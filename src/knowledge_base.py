@@ -13,16 +13,127 @@ Key Features:
 - Intelligent context generation for conversations
 """
 
+import asyncio
+import hashlib
+import heapq
+import itertools
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import mmap
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, timezone
 import json
+import numpy as np
 import openai
 from openai import OpenAI
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard json module
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:  # Token budgets are estimated from characters instead
+    tiktoken = None
 
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
+# Maximum number of articles processed by OpenAI at the same time
+MAX_CONCURRENT_REQUESTS = 8
+
+# Number of recent search results kept in the LRU query cache
+SEARCH_CACHE_SIZE = 256
+
+# Model used to embed entries and queries for semantic search
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Maximum number of texts sent in one embeddings request
+EMBEDDING_BATCH_SIZE = 256
+
+# Search queries are embedded while the user waits for an answer, so a
+# slow embeddings API falls back to keyword search instead (seconds)
+QUERY_EMBEDDING_TIMEOUT = 3.0
+
+# Minimum cosine similarity for an entry to count as a search match
+MIN_SIMILARITY = 0.25
+
+# Maximum article tokens sent to the LLM for extraction; longer articles
+# are truncated, which bounds the cost and latency of each request
+MAX_ARTICLE_TOKENS = 8000
+
+# Rough characters per token, used when tiktoken isn't installed
+CHARS_PER_TOKEN = 4
+
+# Splits lowercased text into word tokens for keyword search
+_TOKEN_RE = re.compile(r"\w+")
+
+# Words too common to say anything about which article matches
+STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "about", "as", "at", "be", "by", "for", "from",
+    "how", "in", "is", "it", "me", "of", "on", "or", "tell", "that", "the",
+    "this", "to", "was", "what", "when", "where", "which", "who", "why", "with",
+})
+
+# Largest magnitude used when storing embeddings as int8
+EMBEDDING_INT8_MAX = 127
+
+# Supported models without structured outputs; these use plain JSON mode
+JSON_MODE_ONLY_MODELS = frozenset({"gpt-4-turbo", "gpt-3.5-turbo"})
+
+# Instructions for extracting knowledge from an article
+EXTRACTION_PROMPT = """You are a knowledge extraction expert. Process the given article and extract:
+                        1. A concise summary (2-3 sentences)
+                        2. Key points and important facts (5-10 bullet points)
+                        3. Main topics covered (3-5 topics)
+                        4. Conversational context (what someone should know to discuss this article)
+                        
+                        Return the result as a JSON object with keys: summary, key_points, topics, context"""
+
+
+def _text_hash(text: str) -> str:
+    """
+    Hash article text to detect articles that were already processed.
+    
+    Args:
+        text: Full article text
+        
+    Returns:
+        Hex digest of the text
+    """
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _map_file(filepath: str) -> Optional[mmap.mmap]:
+    """
+    Memory-map a file read-only.
+    
+    Args:
+        filepath: Path of the file
+        
+    Returns:
+        The mapping, or None for an empty file (which can't be mapped)
+    """
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class ArticleKnowledge(BaseModel):
+    """Schema of the knowledge extracted from an article."""
+    
+    summary: str
+    key_points: List[str]
+    topics: List[str]
+    context: str
+
 
 class KnowledgeBase:
     """
@@ -33,17 +144,77 @@ class KnowledgeBase:
     key points, and provides context for agent conversations.
     """
     
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        embedding_model: str = EMBEDDING_MODEL,
+        structured_output: Optional[bool] = None
+    ):
         """
         Initialize the KnowledgeBase with OpenAI API.
         
         Args:
             api_key: OpenAI API key
             model: OpenAI model to use for processing (default: gpt-4o-mini)
+            embedding_model: OpenAI model used for semantic search embeddings
+            structured_output: Constrain extraction to the ArticleKnowledge
+                schema with structured outputs instead of free-form JSON mode
+                (default: on, unless the model doesn't support it)
         """
         self.client = OpenAI(api_key=api_key)
+        # Client for query embeddings: short timeout, no retries
+        self._query_client = self.client.with_options(timeout=QUERY_EMBEDDING_TIMEOUT, max_retries=0)
         self.model = model
+        self.embedding_model = embedding_model
+        if structured_output is None:
+            structured_output = model not in JSON_MODE_ONLY_MODELS
+        self.structured_output = structured_output
         self.knowledge_store: List[Dict[str, Any]] = []
+        
+        # Source of entry ids; next() on a count is atomic, so entries
+        # stored from different threads never share an id
+        self._next_id = itertools.count()
+        
+        # Stored entries keyed by a hash of their article text, so the same
+        # article isn't sent to OpenAI twice (e.g. under two URLs)
+        self._entries_by_text_hash: Dict[str, Dict[str, Any]] = {}
+        
+        # Memory-mapped full texts of entries loaded from a file; loaded
+        # entries only hold an (offset, length) reference into it
+        self._text_blob: Optional[mmap.mmap] = None
+        
+        # tiktoken encoding for the model, loaded on first use (False if
+        # it couldn't be loaded)
+        self._encoding = None
+        
+        # Searches run in worker threads while entries are stored from the
+        # event loop; this lock guards the search state below, and the
+        # version (bumped on every change to the store) keeps a search that
+        # started before a change from caching results for the old store
+        self._lock = threading.Lock()
+        self._store_version = 0
+        
+        # Normalized entry embeddings, one row per entry, paired with the
+        # list of entries the rows belong to. Built on first search
+        self._embedding_index: Optional[Tuple[np.ndarray, List[Dict[str, Any]]]] = None
+        # Set when some entries have no embedding, so searches use keywords
+        # without rechecking the store; cleared when entries are re-embedded
+        self._embeddings_incomplete = False
+        
+        # Keyword index: token -> {entry position: score contribution}, paired
+        # with the list of entries the positions refer to. Built on first
+        # keyword search, like the embedding index
+        self._keyword_index: Optional[Tuple[Dict[str, Dict[int, int]], List[Dict[str, Any]]]] = None
+        
+        # Conversation context strings keyed by max_articles
+        # Cleared whenever the knowledge store changes
+        self._context_cache: Dict[int, str] = {}
+        self._articles_listing_cache: Optional[str] = None
+        
+        # Recent search results keyed by (lowercased query, top_k), LRU order
+        self._search_cache: "OrderedDict[Tuple[str, int], List[Dict[str, Any]]]" = OrderedDict()
+        
         logger.info(f"KnowledgeBase initialized with model={model}")
     
     def process_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
@@ -67,42 +238,46 @@ class KnowledgeBase:
                 - 'context': Conversational context
                 - 'metadata': Original article metadata
         """
+        existing = self._entries_by_text_hash.get(_text_hash(article['text']))
+        if existing is not None:
+            logger.info(f"Article already in knowledge base: {article.get('url')}")
+            return existing
+        
+        knowledge_entry = self._build_entry(article)
+        self._embed_missing_entries()
+        self._embed_entries([knowledge_entry])
+        
+        # Add to knowledge store
+        self._store_entry(knowledge_entry)
+        
+        return knowledge_entry
+    
+    def _build_entry(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run the OpenAI extraction for an article without storing it.
+        
+        The entry isn't embedded yet; see _embed_entries.
+        
+        Args:
+            article: Article dictionary from ArticleExtractor
+            
+        Returns:
+            Processed knowledge entry
+        """
         try:
             logger.info(f"Processing article: {article.get('title', 'Untitled')}")
             
-            # Prepare the article text with metadata
-            article_text = self._format_article_for_processing(article)
+            # Prepare the article text with metadata, within the token budget
+            text, truncated = self._truncate_to_budget(article['text'])
+            article_text = self._format_article_for_processing({**article, 'text': text})
             
             # Generate comprehensive knowledge extraction
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """You are a knowledge extraction expert. Process the given article and extract:
-                        1. A concise summary (2-3 sentences)
-                        2. Key points and important facts (5-10 bullet points)
-                        3. Main topics covered (3-5 topics)
-                        4. Conversational context (what someone should know to discuss this article)
-                        
-                        Return the result as a JSON object with keys: summary, key_points, topics, context"""
-                    },
-                    {
-                        "role": "user",
-                        "content": article_text
-                    }
-                ],
-                temperature=0.3,  # Lower temperature for more consistent extraction
-                response_format={ "type": "json_object" }  # Ensure JSON response
-            )
-            
-            # Parse the response
-            extracted = json.loads(response.choices[0].message.content)
+            extracted = self._extract_knowledge(article_text)
             
             # Create the knowledge entry
             knowledge_entry = {
-                'id': f"article_{datetime.now().timestamp()}",
-                'processed_at': datetime.now().isoformat(),
+                'id': None,  # Assigned when the entry is stored
+                'processed_at': datetime.now(timezone.utc).isoformat(),
                 'summary': extracted.get('summary', ''),
                 'key_points': extracted.get('key_points', []),
                 'topics': extracted.get('topics', []),
@@ -112,14 +287,13 @@ class KnowledgeBase:
                     'author': article.get('author'),
                     'date': article.get('date'),
                     'url': article.get('url'),
-                    'word_count': article.get('word_count')
+                    'word_count': article.get('word_count'),
+                    'truncated': truncated
                 },
-                'full_text': article['text']  # Keep full text for detailed queries
+                'full_text': article['text'],  # Keep full text for detailed queries
+                'text_hash': _text_hash(article['text'])
             }
             
-            # Add to knowledge store
-            self.knowledge_store.append(knowledge_entry)
-            
             logger.info(f"Successfully processed article into knowledge base")
             return knowledge_entry
             
@@ -127,35 +301,333 @@ class KnowledgeBase:
             logger.error(f"Error processing article: {str(e)}")
             raise
     
-    def add_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _truncate_to_budget(self, text: str) -> Tuple[str, bool]:
+        """
+        Cut article text down to MAX_ARTICLE_TOKENS tokens.
+        
+        Args:
+            text: Full article text
+            
+        Returns:
+            The (possibly shortened) text and whether it was truncated
+        """
+        # Byte-level BPE never produces more tokens than UTF-8 bytes, so
+        # text this short can't exceed the budget; skip encoding it
+        if tiktoken is not None and len(text.encode('utf-8')) <= MAX_ARTICLE_TOKENS:
+            return text, False
+        
+        if tiktoken is not None and self._encoding is None:
+            try:
+                try:
+                    self._encoding = tiktoken.encoding_for_model(self.model)
+                except KeyError:
+                    self._encoding = tiktoken.get_encoding("o200k_base")
+            except Exception as e:
+                # The encoding is downloaded on first use, which can fail;
+                # truncation is optional, so estimate from characters instead
+                logger.warning(f"Could not load tiktoken encoding, estimating tokens from characters: {str(e)}")
+                self._encoding = False
+        
+        if not self._encoding:
+            max_chars = MAX_ARTICLE_TOKENS * CHARS_PER_TOKEN
+            if len(text) <= max_chars:
+                return text, False
+            return text[:max_chars], True
+        
+        tokens = self._encoding.encode(text, disallowed_special=())
+        if len(tokens) <= MAX_ARTICLE_TOKENS:
+            return text, False
+        
+        logger.info(f"Truncating article from {len(tokens)} to {MAX_ARTICLE_TOKENS} tokens")
+        return self._encoding.decode(tokens[:MAX_ARTICLE_TOKENS]), True
+    
+    def _extract_knowledge(self, article_text: str) -> Dict[str, Any]:
+        """
+        Ask the LLM for the summary, key points, topics and context.
+        
+        Args:
+            article_text: Article formatted by _format_article_for_processing
+            
+        Returns:
+            Dictionary with the ArticleKnowledge fields
+            
+        Raises:
+            ValueError: If the model refused to process the article
+        """
+        messages = [
+            {
+                "role": "system",
+                "content": EXTRACTION_PROMPT
+            },
+            {
+                "role": "user",
+                "content": article_text
+            }
+        ]
+        
+        if self.structured_output:
+            # Decoding is constrained to the schema, so the result always parses
+            response = self.client.beta.chat.completions.parse(
+                model=self.model,
+                messages=messages,
+                temperature=0.3,  # Lower temperature for more consistent extraction
+                response_format=ArticleKnowledge
+            )
+            message = response.choices[0].message
+            if message.parsed is None:
+                raise ValueError(f"Model refused to process the article: {message.refusal}")
+            return message.parsed.model_dump()
+        
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=0.3,  # Lower temperature for more consistent extraction
+            response_format={ "type": "json_object" }  # Ensure JSON response
+        )
+        
+        # Parse the response
+        content = response.choices[0].message.content
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
+    
+    def _embed_entries(self, entries: List[Dict[str, Any]]):
+        """
+        Add search embeddings to entries, batching the OpenAI requests.
+        
+        Failures are logged rather than raised; entries left without an
+        embedding are retried by _embed_missing_entries.
+        
+        Args:
+            entries: Entries returned by _build_entry
+        """
+        for start in range(0, len(entries), EMBEDDING_BATCH_SIZE):
+            batch = entries[start:start + EMBEDDING_BATCH_SIZE]
+            try:
+                vectors = self._embed([self._embedding_text(entry) for entry in batch])
+            except Exception as e:
+                logger.warning(f"Could not embed {len(batch)} articles for search: {str(e)}")
+                continue
+            
+            for entry, vector in zip(batch, vectors):
+                entry['_embedding'] = vector
+    
+    def _embed_missing_entries(self):
+        """
+        Retry embedding stored entries whose embedding request failed.
+        
+        Called when articles are added or loaded rather than from
+        search, so an embeddings outage doesn't hold up queries.
+        """
+        with self._lock:
+            missing = [entry for entry in self.knowledge_store if entry.get('_embedding') is None]
+        if not missing:
+            return
+        
+        logger.info(f"Embedding {len(missing)} articles for search")
+        self._embed_entries(missing)
+        with self._lock:
+            # A search that saw the entries unembedded mustn't flag them
+            self._store_version += 1
+            self._embeddings_incomplete = False
+    
+    def _store_entry(self, knowledge_entry: Dict[str, Any]):
+        """
+        Append a processed entry to the knowledge store.
+        
+        Args:
+            knowledge_entry: Entry returned by _build_entry
+        """
+        knowledge_entry['id'] = next(self._next_id)
+        self._add_derived_fields(knowledge_entry)
+        self.knowledge_store.append(knowledge_entry)
+        self._entries_by_text_hash[knowledge_entry['text_hash']] = knowledge_entry
+        self._invalidate_caches()
+    
+    @staticmethod
+    def _add_derived_fields(entry: Dict[str, Any]):
+        """
+        Add fields derived from an entry's content to the entry.
+        
+        These are lowercased copies of the searchable fields, so keyword
+        search doesn't lowercase every field on every query, and
+        preformatted strings used when building context and detailed
+        answers. They start with an underscore so save_to_file skips
+        them; load_entries recomputes them.
+        
+        Args:
+            entry: Knowledge entry
+        """
+        entry['_summary_lc'] = entry['summary'].lower()
+        entry['_key_points_lc'] = [point.lower() for point in entry['key_points']]
+        entry['_topics_lc'] = [topic.lower() for topic in entry['topics']]
+        entry['_context_lc'] = entry['context'].lower()
+        entry['_topics_joined'] = ", ".join(entry['topics'])
+        entry['_details_body'] = "\n".join((
+            entry['summary'],
+            "",
+            "Key points:",
+            *(f"• {point}" for point in entry['key_points']),
+        ))
+        
+        # Files saved before text hashes were stored have the text inline
+        if 'text_hash' not in entry:
+            entry['text_hash'] = _text_hash(entry['full_text'])
+        
+        # Files saved before embeddings moved to a sidecar kept them inline
+        if 'embedding' in entry:
+            entry['_embedding'] = np.asarray(entry.pop('embedding'), dtype=np.float32)
+    
+    def add_articles(
+        self,
+        articles: List[Dict[str, Any]],
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS
+    ) -> List[Dict[str, Any]]:
         """
         Process and add multiple articles to the knowledge base.
         
+        Extraction requests run in a thread pool, at most max_concurrency
+        at a time, and all entries are then embedded in a single batched
+        request. Entries are added to the store in the order of the input.
+        
         Args:
             articles: List of article dictionaries from ArticleExtractor
+            max_concurrency: Maximum number of simultaneous OpenAI requests
             
         Returns:
             List of processed knowledge entries
         """
-        processed = []
+        self._embed_missing_entries()
+        
+        articles = self._new_articles(articles)
+        if not articles:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(articles))) as executor:
+            futures = [executor.submit(self._build_entry, article) for article in articles]
+            entries = [future.exception() or future.result() for future in futures]
+        
+        processed = self._successful_entries(articles, entries)
+        self._embed_entries(processed)
+        return self._store_entries(processed)
+    
+    async def add_articles_async(
+        self,
+        articles: List[Dict[str, Any]],
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS
+    ) -> List[Dict[str, Any]]:
+        """
+        Process and add multiple articles without blocking the event loop.
+        
+        Same as add_articles, with the requests running in worker threads
+        scheduled on the event loop.
+        
+        Args:
+            articles: List of article dictionaries from ArticleExtractor
+            max_concurrency: Maximum number of simultaneous OpenAI requests
+            
+        Returns:
+            List of processed knowledge entries
+        """
+        await asyncio.to_thread(self._embed_missing_entries)
+        
+        articles = self._new_articles(articles)
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
         
+        async def build(article: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(self._build_entry, article)
+        
+        entries = await asyncio.gather(
+            *(build(article) for article in articles),
+            return_exceptions=True
+        )
+        
+        processed = self._successful_entries(articles, entries)
+        await asyncio.to_thread(self._embed_entries, processed)
+        return self._store_entries(processed)
+    
+    def _new_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Drop articles whose text is already stored or earlier in the list.
+        
+        Args:
+            articles: List of article dictionaries from ArticleExtractor
+            
+        Returns:
+            Articles that still need processing
+        """
+        unique_articles = {}
         for article in articles:
-            try:
-                knowledge = self.process_article(article)
-                processed.append(knowledge)
-            except Exception as e:
-                logger.error(f"Failed to process article {article.get('url')}: {str(e)}")
+            text_hash = _text_hash(article['text'])
+            if text_hash in self._entries_by_text_hash or text_hash in unique_articles:
+                logger.info(f"Article already in knowledge base: {article.get('url')}")
                 continue
+            unique_articles[text_hash] = article
+        return list(unique_articles.values())
+    
+    def contains_article(self, article: Dict[str, Any]) -> bool:
+        """
+        Check whether an article's text is already in the knowledge base.
         
-        logger.info(f"Added {len(processed)} articles to knowledge base")
+        Args:
+            article: Article dictionary from ArticleExtractor
+            
+        Returns:
+            True if an entry with the same text is stored
+        """
+        return _text_hash(article['text']) in self._entries_by_text_hash
+    
+    def _successful_entries(
+        self,
+        articles: List[Dict[str, Any]],
+        results: List[Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Log failed extractions and keep the entries that were built.
+        
+        Args:
+            articles: The articles that were processed
+            results: Entry or exception for each article
+            
+        Returns:
+            Built entries, in input order
+        """
+        processed = []
+        for article, entry in zip(articles, results):
+            if isinstance(entry, BaseException):
+                logger.error(f"Failed to process article {article.get('url')}: {str(entry)}")
+                continue
+            processed.append(entry)
         return processed
     
+    def _store_entries(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Add built and embedded entries to the knowledge store.
+        
+        Args:
+            entries: Entries to store, in order
+            
+        Returns:
+            The stored entries
+        """
+        for entry in entries:
+            self._store_entry(entry)
+        
+        logger.info(f"Added {len(entries)} articles to knowledge base")
+        return entries
+    
     def search(self, query: str, top_k: int = 3) -> List[Dict[str, Any]]:
         """
         Search the knowledge base for relevant information.
         
         This method finds the most relevant knowledge entries
-        for a given query using semantic similarity.
+        for a given query using embedding similarity, falling back
+        to keyword matching when embeddings aren't available. It
+        makes an OpenAI request, so call it off the event loop.
+        Semantic results for repeated queries are served from an LRU
+        cache until the knowledge store changes.
         
         Args:
             query: Search query
@@ -168,45 +640,193 @@ class KnowledgeBase:
             logger.warning("Knowledge base is empty")
             return []
         
+        query_lower = query.lower()
+        cache_key = (query_lower, top_k)
+        
+        with self._lock:
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                self._search_cache.move_to_end(cache_key)
+                return list(cached)
+            version = self._store_version
+        
         try:
-            # For now, use a simple relevance scoring
-            # In production, you might want to use embeddings for better search
-            results = []
+            top_results = self._semantic_search(query, top_k)
+            if top_results is None:
+                # Not cached, so the query gets semantic results once the
+                # embeddings API is reachable again
+                return self._keyword_search(query_lower, top_k)
             
-            for entry in self.knowledge_store:
-                # Calculate relevance score based on query presence in key fields
-                score = 0
-                query_lower = query.lower()
-                
-                # Check summary
-                if query_lower in entry['summary'].lower():
-                    score += 3
-                
-                # Check key points
-                for point in entry['key_points']:
-                    if query_lower in point.lower():
-                        score += 2
-                
-                # Check topics
-                for topic in entry['topics']:
-                    if query_lower in topic.lower():
-                        score += 2
-                
-                # Check context
-                if query_lower in entry['context'].lower():
-                    score += 1
-                
-                if score > 0:
-                    results.append((score, entry))
-            
-            # Sort by score and return top_k
-            results.sort(key=lambda x: x[0], reverse=True)
-            return [entry for score, entry in results[:top_k]]
+            with self._lock:
+                if self._store_version == version:
+                    self._search_cache[cache_key] = top_results
+                    if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                        self._search_cache.popitem(last=False)
+            
+            return list(top_results)
             
         except Exception as e:
             logger.error(f"Error searching knowledge base: {str(e)}")
             return []
     
+    def _semantic_search(self, query: str, top_k: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Rank entries by cosine similarity between query and entry embeddings.
+        
+        Args:
+            query: Search query
+            top_k: Number of results to return
+            
+        Returns:
+            Matching entries, best first, or None if semantic search isn't
+            available (entries without embeddings or a failed API call)
+        """
+        index = self._get_embedding_index()
+        if index is None:
+            return None
+        matrix, entries = index
+        
+        try:
+            query_vector = self._embed([query], self._query_client)[0]
+        except Exception as e:
+            logger.warning(f"Could not embed search query, using keyword search: {str(e)}")
+            return None
+        
+        # Rows are normalized, so the dot product is the cosine similarity
+        scores = matrix @ query_vector
+        
+        # Select the top_k in linear time, then order just those
+        if top_k < len(scores):
+            best = np.argpartition(-scores, top_k)[:top_k]
+        else:
+            best = np.arange(len(scores))
+        best = best[np.argsort(-scores[best])]
+        
+        return [entries[i] for i in best if scores[i] >= MIN_SIMILARITY]
+    
+    def _keyword_search(self, query_lower: str, top_k: int) -> List[Dict[str, Any]]:
+        """
+        Rank entries by which fields contain the query's words.
+        
+        Each query word found in an entry adds 3 for the summary, 2 for
+        each key point and topic and 1 for the context, so entries
+        matching more words, in more prominent fields, rank higher.
+        
+        Args:
+            query_lower: Lowercased search query
+            top_k: Number of results to return
+            
+        Returns:
+            Matching entries, best first
+        """
+        postings, entries = self._get_keyword_index()
+        
+        scores: Dict[int, int] = {}
+        for token in set(_TOKEN_RE.findall(query_lower)):
+            for position, weight in postings.get(token, {}).items():
+                scores[position] = scores.get(position, 0) + weight
+        
+        # Highest scores first, earlier entries winning ties; a heap only
+        # keeps top_k candidates instead of sorting every match
+        ranked = heapq.nlargest(top_k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [entries[position] for position, score in ranked]
+    
+    def _get_keyword_index(self) -> Tuple[Dict[str, Dict[int, int]], List[Dict[str, Any]]]:
+        """
+        Get the keyword index, building it if needed.
+        
+        Returns:
+            Mapping from each word to the positions of the entries
+            containing it, with the score that word contributes to each
+            entry, and the list of entries the positions refer to
+        """
+        with self._lock:
+            if self._keyword_index is not None:
+                return self._keyword_index
+            version = self._store_version
+            entries = list(self.knowledge_store)
+        
+        postings: Dict[str, Dict[int, int]] = {}
+        for position, entry in enumerate(entries):
+            fields = [(entry['_summary_lc'], 3), (entry['_context_lc'], 1)]
+            fields.extend((point, 2) for point in entry['_key_points_lc'])
+            fields.extend((topic, 2) for topic in entry['_topics_lc'])
+            
+            for text, weight in fields:
+                for token in set(_TOKEN_RE.findall(text)) - STOP_WORDS:
+                    entry_scores = postings.setdefault(token, {})
+                    entry_scores[position] = entry_scores.get(position, 0) + weight
+        
+        index = (postings, entries)
+        with self._lock:
+            if self._store_version == version:
+                self._keyword_index = index
+        return index
+    
+    def _get_embedding_index(self) -> Optional[Tuple[np.ndarray, List[Dict[str, Any]]]]:
+        """
+        Get the matrix of entry embeddings, building it if needed.
+        
+        Entries without an embedding aren't embedded here, since this
+        runs on the search path; see _embed_missing_entries.
+        
+        Returns:
+            Array of shape (entries, dimensions) and the list of entries
+            its rows belong to, or None if the store is empty or some
+            entries have no embedding
+        """
+        with self._lock:
+            if self._embedding_index is not None:
+                return self._embedding_index
+            if self._embeddings_incomplete:
+                return None
+            version = self._store_version
+            entries = list(self.knowledge_store)
+        
+        if not entries:
+            return None
+        
+        if any(entry.get('_embedding') is None for entry in entries):
+            with self._lock:
+                if self._store_version == version:
+                    self._embeddings_incomplete = True
+            return None
+        
+        index = (np.stack([entry['_embedding'] for entry in entries]), entries)
+        with self._lock:
+            if self._store_version == version:
+                self._embedding_index = index
+        return index
+    
+    def _embed(self, texts: List[str], client: Optional[OpenAI] = None) -> np.ndarray:
+        """
+        Embed texts with OpenAI and L2-normalize the vectors.
+        
+        Args:
+            texts: Texts to embed
+            client: OpenAI client to use (default: self.client)
+            
+        Returns:
+            Array of shape (len(texts), dimensions)
+        """
+        response = (client or self.client).embeddings.create(model=self.embedding_model, input=texts)
+        vectors = np.asarray([item.embedding for item in response.data], dtype=np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors
+    
+    @staticmethod
+    def _embedding_text(entry: Dict[str, Any]) -> str:
+        """
+        Get the text that represents an entry in semantic search.
+        
+        Args:
+            entry: Knowledge entry
+            
+        Returns:
+            Summary, context and topics joined into one string
+        """
+        return "\n".join((entry['summary'], entry['context'], " ".join(entry['topics'])))
+    
     def get_conversation_context(self, max_articles: int = 3) -> str:
         """
         Generate conversation context from the knowledge base.
@@ -223,6 +843,10 @@ class KnowledgeBase:
         if not self.knowledge_store:
             return "No articles have been loaded into the knowledge base yet."
         
+        cached = self._context_cache.get(max_articles)
+        if cached is not None:
+            return cached
+        
         # Get the most recent articles
         recent_articles = self.knowledge_store[-max_articles:]
         
@@ -233,17 +857,42 @@ class KnowledgeBase:
         
         for i, entry in enumerate(recent_articles, 1):
             title = entry['metadata'].get('title', 'Untitled Article')
-            summary = entry['summary']
-            topics = ", ".join(entry['topics'])
             
-            context_parts.append(f"{i}. {title}")
-            context_parts.append(f"   Summary: {summary}")
-            context_parts.append(f"   Topics: {topics}")
-            context_parts.append("")
+            context_parts.extend((
+                f"{i}. {title}",
+                f"   Summary: {entry['summary']}",
+                f"   Topics: {entry['_topics_joined']}",
+                "",
+            ))
         
         context_parts.append("I can discuss any of these topics in detail based on the articles I've processed.")
         
-        return "\n".join(context_parts)
+        context = "\n".join(context_parts)
+        self._context_cache[max_articles] = context
+        return context
+    
+    def get_articles_listing(self) -> str:
+        """
+        Get a human-readable listing of all articles in the knowledge base.
+        
+        The listing is cached until the knowledge store changes.
+        
+        Returns:
+            Listing with each article's title and first topics
+        """
+        if not self.knowledge_store:
+            return "No articles are currently loaded in the knowledge base."
+        
+        if self._articles_listing_cache is None:
+            articles = []
+            for entry in self.knowledge_store:
+                title = entry['metadata'].get('title', 'Untitled')
+                topics = ", ".join(entry['topics'][:3])  # First 3 topics
+                articles.append(f"• {title} - Topics: {topics}")
+            
+            self._articles_listing_cache = "Articles in my knowledge base:\n" + "\n".join(articles)
+        
+        return self._articles_listing_cache
     
     def get_detailed_info(self, topic: str) -> Optional[str]:
         """
@@ -265,18 +914,10 @@ class KnowledgeBase:
         
         entry = results[0]
         
-        # Build detailed response
-        details = []
-        details.append(f"Based on '{entry['metadata'].get('title', 'the article')}', here's what I know about {topic}:")
-        details.append("")
-        details.append(entry['summary'])
-        details.append("")
-        details.append("Key points:")
-        
-        for point in entry['key_points']:
-            details.append(f"• {point}")
-        
-        return "\n".join(details)
+        # Only the first line depends on the topic; the rest is rendered
+        # once per entry
+        title = entry['metadata'].get('title', 'the article')
+        return f"Based on '{title}', here's what I know about {topic}:\n\n{entry['_details_body']}"
     
     def _format_article_for_processing(self, article: Dict[str, Any]) -> str:
         """
@@ -289,33 +930,138 @@ class KnowledgeBase:
             Formatted article text
         """
         parts = []
+        append = parts.append
         
         # Add metadata if available
-        if article.get('title'):
-            parts.append(f"Title: {article['title']}")
+        title, author, date = article.get('title'), article.get('author'), article.get('date')
+        if title:
+            append(f"Title: {title}")
         
-        if article.get('author'):
-            parts.append(f"Author: {article['author']}")
+        if author:
+            append(f"Author: {author}")
         
-        if article.get('date'):
-            parts.append(f"Date: {article['date']}")
+        if date:
+            append(f"Date: {date}")
         
-        parts.append("")
-        parts.append("Article Content:")
-        parts.append(article['text'])
+        append("\nArticle Content:")
+        append(article['text'])
         
         return "\n".join(parts)
     
+    def load_entries(self, entries: List[Dict[str, Any]]):
+        """
+        Replace the knowledge store with already processed entries.
+        
+        Args:
+            entries: Knowledge entries, e.g. from another KnowledgeBase
+        """
+        self.knowledge_store = list(entries)
+        for entry in self.knowledge_store:
+            self._add_derived_fields(entry)
+        
+        # Continue numbering after the loaded entries (older files used
+        # timestamp strings as ids, which are left as they are)
+        ids = [entry['id'] for entry in self.knowledge_store if isinstance(entry.get('id'), int)]
+        self._next_id = itertools.count(max(ids, default=-1) + 1)
+        
+        self._entries_by_text_hash = {entry['text_hash']: entry for entry in self.knowledge_store}
+        self._invalidate_caches()
+    
+    def get_full_text(self, entry: Dict[str, Any]) -> str:
+        """
+        Get the full article text of an entry.
+        
+        Entries loaded from a file read their text from the memory-mapped
+        text file on demand, so only texts actually used are paged in.
+        
+        Args:
+            entry: Knowledge entry
+            
+        Returns:
+            The article text
+        """
+        if 'full_text' in entry:
+            return entry['full_text']
+        
+        offset, length = entry['_full_text_ref']
+        if not length:
+            return ""
+        return self._text_blob[offset:offset + length].decode('utf-8')
+    
+    def _invalidate_caches(self):
+        """Drop derived strings after the knowledge store has changed."""
+        self._context_cache.clear()
+        self._articles_listing_cache = None
+        with self._lock:
+            self._store_version += 1
+            self._search_cache.clear()
+            self._embedding_index = None
+            self._embeddings_incomplete = False
+            self._keyword_index = None
+    
     def save_to_file(self, filepath: str):
         """
         Save the knowledge base to a JSON file.
         
+        Search embeddings are saved next to it as an int8 NumPy array in
+        filepath + ".npy", so loading doesn't have to re-embed entries,
+        and full article texts are concatenated into filepath + ".txt",
+        which is memory-mapped on load instead of parsed.
+        
         Args:
             filepath: Path to save the knowledge base
         """
+        # Each file is written under a temporary name unique to this process
+        # and then renamed over the old one, so concurrent saves of the same
+        # path don't interleave. The JSON goes last: it references offsets in
+        # the text file, and its mtime is what cache TTL checks read
+        suffix = f".{os.getpid()}.tmp"
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.knowledge_store, f, indent=2, ensure_ascii=False)
+            # Save the entries the embedding rows belong to, in case the
+            # store changes while saving
+            store = list(self.knowledge_store)
+            embeddings_path = filepath + ".npy"
+            index = self._get_embedding_index()
+            if index is not None:
+                matrix, store = index
+                # int8 is a quarter of the size and ranks practically the same;
+                # rows are scaled to the full int8 range and renormalized on
+                # load, so the scale factors don't need to be stored
+                scales = EMBEDDING_INT8_MAX / np.abs(matrix).max(axis=1, keepdims=True)
+                quantized = np.round(matrix * scales).astype(np.int8)
+                # np.save appends ".npy" to paths, so give it a file object
+                with open(embeddings_path + suffix, 'wb') as f:
+                    np.save(f, quantized)
+                os.replace(embeddings_path + suffix, embeddings_path)
+            elif os.path.exists(embeddings_path):
+                os.remove(embeddings_path)
+            
+            # The current text file may be memory-mapped by this knowledge
+            # base; replacing it leaves that mapping intact
+            texts_path = filepath + ".txt"
+            entries = []
+            with open(texts_path + suffix, 'wb') as texts_file:
+                for entry in store:
+                    data = self.get_full_text(entry).encode('utf-8')
+                    
+                    # Derived fields (underscore keys) are rebuilt on load
+                    saved = {
+                        key: value for key, value in entry.items()
+                        if not key.startswith('_') and key != 'full_text'
+                    }
+                    saved['full_text_ref'] = [texts_file.tell(), len(data)]
+                    entries.append(saved)
+                    
+                    texts_file.write(data)
+            os.replace(texts_path + suffix, texts_path)
+            
+            if orjson is not None:
+                with open(filepath + suffix, 'wb') as f:
+                    f.write(orjson.dumps(entries, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath + suffix, 'w', encoding='utf-8') as f:
+                    json.dump(entries, f, indent=2, ensure_ascii=False)
+            os.replace(filepath + suffix, filepath)
             logger.info(f"Knowledge base saved to {filepath}")
         except Exception as e:
             logger.error(f"Error saving knowledge base: {str(e)}")
@@ -325,16 +1071,56 @@ class KnowledgeBase:
         """
         Load a knowledge base from a JSON file.
         
+        Embeddings are read from the filepath + ".npy" sidecar written by
+        save_to_file; entries are re-embedded if it's missing or doesn't
+        match the file. Full texts stay in the memory-mapped
+        filepath + ".txt" until get_full_text reads them.
+        
         Args:
             filepath: Path to load the knowledge base from
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                self.knowledge_store = json.load(f)
+            if orjson is not None:
+                with open(filepath, 'rb') as f:
+                    entries = orjson.loads(f.read())
+            else:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    entries = json.load(f)
+            
+            if any('full_text_ref' in entry for entry in entries):
+                self._text_blob = _map_file(filepath + ".txt")
+                for entry in entries:
+                    if 'full_text_ref' in entry:
+                        entry['_full_text_ref'] = tuple(entry.pop('full_text_ref'))
+            
+            self.load_entries(entries)
+            self._load_embeddings(filepath + ".npy")
             logger.info(f"Knowledge base loaded from {filepath}")
         except Exception as e:
             logger.error(f"Error loading knowledge base: {str(e)}")
             raise
+    
+    def _load_embeddings(self, embeddings_path: str):
+        """
+        Attach saved embeddings to the loaded entries, re-embedding if needed.
+        
+        Args:
+            embeddings_path: Path of the .npy sidecar written by save_to_file
+        """
+        if os.path.exists(embeddings_path):
+            matrix = np.load(embeddings_path)
+            if matrix.dtype == np.int8:
+                matrix = matrix.astype(np.float32)
+                matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+            if matrix.ndim == 2 and len(matrix) == len(self.knowledge_store):
+                for entry, vector in zip(self.knowledge_store, matrix):
+                    entry['_embedding'] = vector
+                with self._lock:
+                    self._embedding_index = (matrix, list(self.knowledge_store))
+                return
+            logger.warning(f"Ignoring embeddings in {embeddings_path}: shape {matrix.shape} doesn't match the knowledge base")
+        
+        self._embed_missing_entries()
 
 
 # Example usage and testing
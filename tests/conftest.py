@@ -0,0 +1,93 @@
+"""
+Shared test fixtures.
+
+FakeOpenAI stands in for the OpenAI client, so knowledge bases can be
+built, searched, saved and loaded without network access.
+"""
+
+import re
+import zlib
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from src.knowledge_base import ArticleKnowledge, KnowledgeBase
+
+# Dimensions of the fake embeddings
+EMBEDDING_DIMENSIONS = 64
+
+
+def fake_embedding(text: str) -> List[float]:
+    """Embed text as hashed word counts, so similar texts rank close together."""
+    vector = [0.01] * EMBEDDING_DIMENSIONS
+    for word in re.findall(r"\w+", text.lower()):
+        vector[zlib.crc32(word.encode()) % EMBEDDING_DIMENSIONS] += 1.0
+    return vector
+
+
+class FakeOpenAI:
+    """Minimal OpenAI client that records the requests made to it."""
+    
+    def __init__(self):
+        self.embedding_requests: List[List[str]] = []
+        self.extraction_requests: List[str] = []
+        self.fail_embeddings = False
+        
+        self.embeddings = SimpleNamespace(create=self._create_embeddings)
+        self.beta = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(parse=self._parse))
+        )
+    
+    def with_options(self, **options: Any) -> "FakeOpenAI":
+        return self
+    
+    def _create_embeddings(self, model: str, input: List[str]) -> Any:
+        self.embedding_requests.append(list(input))
+        if self.fail_embeddings:
+            raise ConnectionError("embeddings unavailable")
+        return SimpleNamespace(data=[SimpleNamespace(embedding=fake_embedding(text)) for text in input])
+    
+    def _parse(self, model: str, messages: List[Dict[str, str]], **kwargs: Any) -> Any:
+        article_text = messages[-1]["content"]
+        self.extraction_requests.append(article_text)
+        
+        content = article_text.split("Article Content:\n", 1)[-1]
+        knowledge = ArticleKnowledge(
+            summary=content[:200],
+            key_points=[content[:50]],
+            topics=content.split()[:2],
+            context=f"An article about {content[:50]}",
+        )
+        message = SimpleNamespace(parsed=knowledge, refusal=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def use_fake_client(knowledge_base: KnowledgeBase, client: FakeOpenAI) -> KnowledgeBase:
+    """Point a knowledge base's OpenAI clients at a fake client."""
+    knowledge_base.client = client
+    knowledge_base._query_client = client
+    return knowledge_base
+
+
+def make_article(url: str, text: str, title: str = "Test article") -> Dict[str, Any]:
+    """Build an article dictionary as returned by ArticleExtractor."""
+    return {
+        'text': text,
+        'title': title,
+        'author': None,
+        'date': None,
+        'url': url,
+        'domain': "example.com",
+        'word_count': len(text.split()),
+    }
+
+
+@pytest.fixture
+def fake_openai() -> FakeOpenAI:
+    return FakeOpenAI()
+
+
+@pytest.fixture
+def knowledge_base(fake_openai: FakeOpenAI) -> KnowledgeBase:
+    return use_fake_client(KnowledgeBase(api_key="test-key"), fake_openai)
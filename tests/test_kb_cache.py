@@ -0,0 +1,183 @@
+"""Tests for the on-disk knowledge base cache in src.agent."""
+
+import json
+import os
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from src import agent
+from src.agent import VoiceAgent, clear_kb_cache
+from tests.conftest import FakeOpenAI, make_article, use_fake_client
+
+URLS = ["https://example.com/one", "https://example.com/two"]
+
+TEXTS = {
+    URLS[0]: "Solar panels convert sunlight into electricity for homes.",
+    URLS[1]: "Tide pools host anemones, crabs and small fish at low tide.",
+}
+
+
+class StubExtractor:
+    """ArticleExtractor stand-in serving fixed articles; other URLs fail."""
+    
+    def __init__(self, available: List[str]):
+        self.available = set(available)
+        self.requested: List[str] = []
+    
+    def _extract(self, url: str) -> Optional[Dict[str, Any]]:
+        self.requested.append(url)
+        if url not in self.available:
+            return None
+        return make_article(url, TEXTS[url])
+    
+    def extract_multiple(self, urls: List[str]) -> List[Dict[str, Any]]:
+        return [article for article in map(self._extract, urls) if article]
+    
+    async def extract_multiple_async(self, urls: List[str]) -> List[Dict[str, Any]]:
+        return self.extract_multiple(urls)
+    
+    def close(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def kb_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(agent, "KB_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def make_agent(available: List[str] = URLS):
+    """Create a VoiceAgent for URLS with a stub extractor and fake OpenAI client."""
+    config = SimpleNamespace(openai_api_key="test-key", llm_model="gpt-4o-mini")
+    voice_agent = VoiceAgent(config)
+    voice_agent.article_extractor = StubExtractor(available)
+    client = FakeOpenAI()
+    use_fake_client(voice_agent.knowledge_base, client)
+    voice_agent.add_article_urls(URLS)
+    return voice_agent, client
+
+
+def cached_urls(voice_agent: VoiceAgent) -> List[str]:
+    return [entry['metadata']['url'] for entry in voice_agent.knowledge_base.knowledge_store]
+
+
+def age_file(path: str, seconds: float) -> float:
+    """Set a file's modification time to the given number of seconds ago."""
+    mtime = time.time() - seconds
+    os.utime(path, (mtime, mtime))
+    return mtime
+
+
+def test_cache_hit_within_ttl_skips_extraction():
+    first, first_client = make_agent()
+    first.prepare_knowledge_base()
+    assert len(first_client.extraction_requests) == 2
+    
+    second, second_client = make_agent()
+    second.prepare_knowledge_base()
+    
+    assert second.article_extractor.requested == []
+    assert second_client.extraction_requests == []
+    assert second_client.embedding_requests == []
+    assert cached_urls(second) == URLS
+
+
+def test_expired_cache_is_rebuilt():
+    first, _ = make_agent()
+    first.prepare_knowledge_base()
+    age_file(agent._kb_cache_path(URLS), agent.KB_CACHE_TTL + 60)
+    
+    second, second_client = make_agent()
+    second.prepare_knowledge_base()
+    
+    assert second.article_extractor.requested == URLS
+    assert len(second_client.extraction_requests) == 2
+    assert time.time() - os.path.getmtime(agent._kb_cache_path(URLS)) < 60
+
+
+def test_partial_build_is_cached_with_failed_urls():
+    first, _ = make_agent(available=URLS[:1])
+    first.prepare_knowledge_base()
+    
+    cache_path = agent._kb_cache_path(URLS)
+    with open(cache_path + ".failed", encoding='utf-8') as f:
+        assert json.load(f) == URLS[1:]
+    
+    # Within the retry TTL the failed URL isn't fetched again
+    second, second_client = make_agent()
+    second.prepare_knowledge_base()
+    
+    assert second.article_extractor.requested == []
+    assert second_client.extraction_requests == []
+    assert cached_urls(second) == URLS[:1]
+
+
+def test_failed_urls_are_retried_after_retry_ttl():
+    first, _ = make_agent(available=URLS[:1])
+    first.prepare_knowledge_base()
+    
+    cache_path = agent._kb_cache_path(URLS)
+    built_at = age_file(cache_path, agent.KB_CACHE_RETRY_TTL + 120)
+    age_file(cache_path + ".failed", agent.KB_CACHE_RETRY_TTL + 60)
+    
+    second, second_client = make_agent()
+    second.prepare_knowledge_base()
+    
+    # Only the failed URL is fetched and processed
+    assert second.article_extractor.requested == URLS[1:]
+    assert len(second_client.extraction_requests) == 1
+    assert cached_urls(second) == URLS
+    
+    # The cache is complete now, and keeps its original expiry
+    assert not os.path.exists(cache_path + ".failed")
+    assert os.path.getmtime(cache_path) == pytest.approx(built_at, abs=1e-3)
+    
+    third, _ = make_agent()
+    third.prepare_knowledge_base()
+    assert third.article_extractor.requested == []
+    assert cached_urls(third) == URLS
+
+
+def test_failed_retry_restarts_retry_ttl():
+    first, _ = make_agent(available=URLS[:1])
+    first.prepare_knowledge_base()
+    
+    cache_path = agent._kb_cache_path(URLS)
+    built_at = age_file(cache_path, agent.KB_CACHE_RETRY_TTL + 120)
+    age_file(cache_path + ".failed", agent.KB_CACHE_RETRY_TTL + 60)
+    
+    second, _ = make_agent(available=URLS[:1])
+    second.prepare_knowledge_base()
+    
+    assert second.article_extractor.requested == URLS[1:]
+    assert os.path.getmtime(cache_path) == pytest.approx(built_at, abs=1e-3)
+    assert time.time() - os.path.getmtime(cache_path + ".failed") < 60
+    
+    third, _ = make_agent(available=URLS[:1])
+    third.prepare_knowledge_base()
+    assert third.article_extractor.requested == []
+
+
+def test_without_cache_nothing_is_written():
+    voice_agent, _ = make_agent()
+    voice_agent.use_kb_cache = False
+    voice_agent.prepare_knowledge_base()
+    
+    assert cached_urls(voice_agent) == URLS
+    assert not os.path.exists(agent._kb_cache_path(URLS))
+
+
+def test_clear_kb_cache_removes_all_files():
+    first, _ = make_agent(available=URLS[:1])
+    first.prepare_knowledge_base()
+    
+    cache_path = agent._kb_cache_path(URLS)
+    sidecars = [cache_path + suffix for suffix in (".npy", ".txt", ".failed")]
+    assert all(os.path.exists(path) for path in [cache_path, *sidecars])
+    
+    clear_kb_cache(URLS)
+    
+    assert not any(os.path.exists(path) for path in [cache_path, *sidecars])
@@ -0,0 +1,120 @@
+"""Round-trip tests for KnowledgeBase.save_to_file and load_from_file."""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.knowledge_base import KnowledgeBase
+from tests.conftest import FakeOpenAI, make_article, use_fake_client
+
+ARTICLES = [
+    make_article("https://example.com/solar", "Solar panels convert sunlight into electricity for homes.", "Solar"),
+    make_article("https://example.com/tides", "Tide pools host anemones, crabs and small fish at low tide.", "Tides"),
+    make_article("https://example.com/bread", "Sourdough bread rises slowly with wild yeast and bacteria.", "Bread"),
+]
+
+QUERIES = ["solar electricity", "crabs in tide pools", "sourdough yeast"]
+
+
+def new_knowledge_base() -> KnowledgeBase:
+    return use_fake_client(KnowledgeBase(api_key="test-key"), FakeOpenAI())
+
+
+def search_ids(knowledge_base: KnowledgeBase, query: str):
+    return [entry['id'] for entry in knowledge_base.search(query, top_k=3)]
+
+
+@pytest.fixture
+def saved_path(knowledge_base, tmp_path):
+    knowledge_base.add_articles(ARTICLES)
+    path = str(tmp_path / "kb.json")
+    knowledge_base.save_to_file(path)
+    return path
+
+
+def test_round_trip_preserves_entries_and_ranking(knowledge_base, saved_path):
+    loaded = new_knowledge_base()
+    loaded.load_from_file(saved_path)
+    
+    # Embeddings come from the .npy sidecar, not from OpenAI
+    assert loaded.client.embedding_requests == []
+    
+    assert len(loaded.knowledge_store) == len(ARTICLES)
+    for original, entry in zip(knowledge_base.knowledge_store, loaded.knowledge_store):
+        assert entry['id'] == original['id']
+        assert entry['text_hash'] == original['text_hash']
+        assert 'full_text' not in entry
+        assert loaded.get_full_text(entry) == original['full_text']
+    
+    for position, query in enumerate(QUERIES):
+        assert search_ids(loaded, query) == search_ids(knowledge_base, query) == [position]
+    
+    # Ids continue after the loaded entries
+    loaded.add_articles([make_article("https://example.com/new", "Something else entirely.")])
+    assert loaded.knowledge_store[-1]['id'] == len(ARTICLES)
+
+
+def test_legacy_file_is_loaded_and_embedded(tmp_path):
+    # The original format: one JSON file, inline text, timestamp ids
+    legacy_entries = [
+        {
+            'id': f"article_{1700000000 + i}.5",
+            'processed_at': "2024-01-15T10:00:00",
+            'summary': article['text'],
+            'key_points': [article['text']],
+            'topics': article['text'].split()[:2],
+            'context': f"An article about {article['title']}",
+            'metadata': {'title': article['title'], 'url': article['url']},
+            'full_text': article['text'],
+        }
+        for i, article in enumerate(ARTICLES)
+    ]
+    path = tmp_path / "legacy.json"
+    path.write_text(json.dumps(legacy_entries), encoding='utf-8')
+    
+    loaded = new_knowledge_base()
+    loaded.load_from_file(str(path))
+    
+    assert [len(request) for request in loaded.client.embedding_requests] == [len(ARTICLES)]
+    for article, entry in zip(ARTICLES, loaded.knowledge_store):
+        assert loaded.get_full_text(entry) == article['text']
+        assert loaded.contains_article(article)
+    
+    assert search_ids(loaded, "crabs in tide pools")[0] == legacy_entries[1]['id']
+    
+    # String ids are kept, and new entries are numbered from zero
+    loaded.add_articles([make_article("https://example.com/new", "Something else entirely.")])
+    assert loaded.knowledge_store[-1]['id'] == 0
+
+
+def test_mismatched_embeddings_are_recomputed(knowledge_base, saved_path):
+    matrix = np.load(saved_path + ".npy")
+    np.save(saved_path + ".npy", matrix[:-1])
+    
+    loaded = new_knowledge_base()
+    loaded.load_from_file(saved_path)
+    
+    assert [len(request) for request in loaded.client.embedding_requests] == [len(ARTICLES)]
+    for query in QUERIES:
+        assert search_ids(loaded, query) == search_ids(knowledge_base, query)
+
+
+def test_resave_over_mapped_text_file(saved_path):
+    loaded = new_knowledge_base()
+    loaded.load_from_file(saved_path)
+    
+    extra = make_article("https://example.com/new", "Glaciers carve valleys over thousands of years.")
+    loaded.add_articles([extra])
+    loaded.save_to_file(saved_path)
+    
+    # Entries loaded earlier still read from the old mapping
+    for article, entry in zip(ARTICLES, loaded.knowledge_store):
+        assert loaded.get_full_text(entry) == article['text']
+    
+    reloaded = new_knowledge_base()
+    reloaded.load_from_file(saved_path)
+    assert [reloaded.get_full_text(entry) for entry in reloaded.knowledge_store] == [
+        article['text'] for article in [*ARTICLES, extra]
+    ]
+    assert reloaded.client.embedding_requests == []